@@ -1 +1,3 @@
 from puya_bignumber.bignumber import *
+from puya_bignumber.bignum import *
+from puya_bignumber.curve import *
@@ -0,0 +1,206 @@
+from algopy import arc4, Bytes, subroutine, UInt64
+from algopy.op import bzero, concat, extract, itob, substring
+from .common import pad, max_value, strip_leading_zero_digits
+from .bignumber import (
+    BIGINT_BYTE_SIZE_INT,
+    UINT256_BYTE_SIZE_INT,
+    UInt256,
+    _add_digits,
+    _less_than_digits,
+    _multiply_digits,
+    _divide_digits,
+    _encode_uint256_digits,
+    _uint256_digits_to_bytes,
+    _calc_mod_barrett_reduce,
+    barrett_reducer_factor,
+    modexp_barrett_reduce_assumption_validation,
+    modexp_barrett_reduce_post_validation,
+)
+import typing
+
+__all__ = [
+    "BigNum",
+    "to_bignum",
+    "from_bignum",
+    "bignum_add",
+    "bignum_subtract",
+    "bignum_equal",
+    "bignum_multiply",
+    "bignum_divide",
+    "bignum_less_than",
+    "bignum_greater_than",
+    "bignum_barrett_reducer_factor",
+    "bignum_mod_barrett_reduce",
+    "bignum_modexp_barrett_reduce",
+]
+
+
+# Big-endian number padded to a multiple of 512 bit digits, without leading zero digits.
+# Zero is a single zero digit. Chained operators keep this layout, so inputs are only
+# converted once with to_bignum and from_bignum.
+class BigNum(typing.NamedTuple):
+    value: Bytes
+    digits: UInt64
+
+
+@subroutine
+def to_bignum(num: Bytes) -> BigNum:
+    BIGINT_BYTE_SIZE: UInt64 = UInt64(BIGINT_BYTE_SIZE_INT)
+    value: Bytes = strip_leading_zero_digits(num, BIGINT_BYTE_SIZE)
+    if value.length == 0:
+        value = bzero(BIGINT_BYTE_SIZE)
+    return BigNum(value, value.length // BIGINT_BYTE_SIZE)
+
+
+@subroutine
+def from_bignum(num: BigNum) -> Bytes:
+    return num.value
+
+
+@subroutine
+def _from_digits(value: Bytes) -> BigNum:
+    # Assume value is padded to a multiple of BIGINT_BYTE_SIZE, with at least one digit.
+    # Cheaper than to_bignum, which pads first.
+    BIGINT_BYTE_SIZE: UInt64 = UInt64(BIGINT_BYTE_SIZE_INT)
+    zero_digit: Bytes = bzero(BIGINT_BYTE_SIZE)
+    while (
+        value.length > BIGINT_BYTE_SIZE
+        and extract(value, 0, BIGINT_BYTE_SIZE) == zero_digit
+    ):
+        value = substring(value, BIGINT_BYTE_SIZE, value.length)
+    return BigNum(value, value.length // BIGINT_BYTE_SIZE)
+
+
+@subroutine
+def _is_zero(num: BigNum) -> bool:
+    BIGINT_BYTE_SIZE: UInt64 = UInt64(BIGINT_BYTE_SIZE_INT)
+    return num.digits == 1 and num.value == bzero(BIGINT_BYTE_SIZE)
+
+
+@subroutine
+def _align(a: BigNum, b: BigNum) -> tuple[Bytes, Bytes]:
+    if a.digits == b.digits:
+        return a.value, b.value
+    BIGINT_BYTE_SIZE: UInt64 = UInt64(BIGINT_BYTE_SIZE_INT)
+    length: UInt64 = max_value(a.digits, b.digits) * BIGINT_BYTE_SIZE
+    return pad(a.value, length), pad(b.value, length)
+
+
+@subroutine
+def bignum_add(a: BigNum, b: BigNum) -> BigNum:
+    BIGINT_BYTE_SIZE: UInt64 = UInt64(BIGINT_BYTE_SIZE_INT)
+    a_digits, b_digits = _align(a, b)
+    result, carry = _add_digits(a_digits, b_digits)
+    n: UInt64 = result.length // BIGINT_BYTE_SIZE
+
+    if carry == 0:
+        return BigNum(result, n)
+
+    carry_digit: Bytes = pad(itob(carry), BIGINT_BYTE_SIZE)
+    return BigNum(concat(carry_digit, result), n + 1)
+
+
+@subroutine
+def bignum_subtract(a: BigNum, b: BigNum) -> BigNum:
+    # Assume a >= b. Then a - b = ~(~a + b), as ~x = 2 ** (8 * length) - 1 - x, so a single
+    # pass of additions replaces adding the two's complement of b.
+    a_digits, b_digits = _align(a, b)
+    inverse_difference, carry = _add_digits(~a_digits, b_digits)
+    return _from_digits(~inverse_difference)
+
+
+@subroutine
+def bignum_equal(a: BigNum, b: BigNum) -> bool:
+    return a.digits == b.digits and a.value == b.value
+
+
+@subroutine
+def bignum_less_than(a: BigNum, b: BigNum) -> bool:
+    # Neither has leading zero digits, so the digit counts decide unless equal
+    if a.digits != b.digits:
+        return a.digits < b.digits
+    return _less_than_digits(a.value, b.value)
+
+
+@subroutine
+def bignum_greater_than(a: BigNum, b: BigNum) -> bool:
+    return bignum_less_than(b, a)
+
+
+@subroutine
+def bignum_multiply(a: BigNum, b: BigNum) -> BigNum:
+    BIGINT_BYTE_SIZE: UInt64 = UInt64(BIGINT_BYTE_SIZE_INT)
+    if _is_zero(a):
+        return a
+    if _is_zero(b):
+        return b
+    a_digits, b_digits = _align(a, b)
+    product: Bytes = _multiply_digits(a_digits, b_digits)
+
+    # The product of nonzero numbers of m and n digits has m + n or m + n - 1 digits
+    digits: UInt64 = a.digits + b.digits
+    length: UInt64 = digits * BIGINT_BYTE_SIZE
+    product = pad(product, max_value(product.length, length))
+    value: Bytes = extract(product, product.length - length, length)
+    if extract(value, 0, BIGINT_BYTE_SIZE) == bzero(BIGINT_BYTE_SIZE):
+        return BigNum(substring(value, BIGINT_BYTE_SIZE, length), digits - 1)
+    return BigNum(value, digits)
+
+
+@subroutine
+def bignum_divide(u: BigNum, v: BigNum) -> BigNum:
+    assert not _is_zero(v), "Non-zero divisor"
+    BIGINT_BYTE_SIZE: UInt64 = UInt64(BIGINT_BYTE_SIZE_INT)
+    if bignum_less_than(u, v):
+        return BigNum(bzero(BIGINT_BYTE_SIZE), UInt64(1))
+    q: Bytes = _uint256_digits_to_bytes(
+        _divide_digits(_to_uint256_digits(u), _to_uint256_digits(v))
+    )
+
+    # Align the 256 bit quotient digits to 512 bit digits
+    UINT256_BYTE_SIZE: UInt64 = UInt64(UINT256_BYTE_SIZE_INT)
+    if q.length % BIGINT_BYTE_SIZE != 0:
+        q = concat(bzero(UINT256_BYTE_SIZE), q)
+    return _from_digits(q)
+
+
+@subroutine
+def _to_uint256_digits(num: BigNum) -> arc4.DynamicArray[UInt256]:
+    # Assume num is nonzero. Without leading zero 512 bit digits, at most the leading 256 bit
+    # half digit is zero.
+    UINT256_BYTE_SIZE: UInt64 = UInt64(UINT256_BYTE_SIZE_INT)
+    value: Bytes = num.value
+    if extract(value, 0, UINT256_BYTE_SIZE) == bzero(UINT256_BYTE_SIZE):
+        value = substring(value, UINT256_BYTE_SIZE, value.length)
+    return _encode_uint256_digits(value)
+
+
+@subroutine
+def bignum_barrett_reducer_factor(mod: BigNum) -> BigNum:
+    # The factor depends on the byte length of mod, so must be computed on the padded value
+    return to_bignum(barrett_reducer_factor(mod.value))
+
+
+@subroutine
+def bignum_mod_barrett_reduce(
+    a: BigNum, mod: BigNum, precomputed_factor: BigNum
+) -> BigNum:
+    # Assume: 0 <= a < mod ** 2, mod > 0, and mod is not a power of two
+    modexp_barrett_reduce_assumption_validation(a.value, mod.value)
+    # The remainder has the byte length of mod, which is digit aligned
+    return _from_digits(
+        _calc_mod_barrett_reduce(a.value, mod.value, precomputed_factor.value)
+    )
+
+
+@subroutine
+def bignum_modexp_barrett_reduce(
+    base: BigNum, exp: Bytes, mod: BigNum, precomputed_factor: BigNum
+) -> BigNum:
+    # exp stays raw bytes, as every leading zero bit would cost a squaring
+    modexp_barrett_reduce_assumption_validation(base.value, mod.value)
+    return to_bignum(
+        modexp_barrett_reduce_post_validation(
+            base.value, exp, mod.value, precomputed_factor.value
+        )
+    )
@@ -1,11 +1,23 @@
 from algopy import arc4, Bytes, subroutine, BigUInt, UInt64, urange
-from algopy.op import substring, bzero, concat, extract, itob, btoi, getbit
+from algopy.op import (
+    substring,
+    bzero,
+    concat,
+    extract,
+    itob,
+    btoi,
+    getbit,
+    bitlen,
+    bsqrt,
+)
 from .common import (
     pad,
     max_value,
     enclosing_multiple,
     pad_as_multiple,
     decode_dynamic_bytes,
+    strip_leading_zero_digits,
+    power_of_two,
 )
 import typing
 
@@ -22,6 +34,9 @@ __all__ = [
     "modexp_barrett_reduce",
     "modexp_barrett_reduce_assumption_validation",
     "modexp_barrett_reduce_post_validation",
+    "isqrt",
+    "iroot",
+    "verify_isqrt",
 ]
 
 BIGINT_BYTE_SIZE_INT: int = 64
@@ -36,7 +51,19 @@ def add(a: Bytes, b: Bytes) -> Bytes:
     length: UInt64 = enclosing_multiple(max_value(a.length, b.length), BIGINT_BYTE_SIZE)
     a_digits: Bytes = pad(a, length)
     b_digits: Bytes = pad(b, length)
+    result, carry = _add_digits(a_digits, b_digits)
+
+    if carry == 0:
+        return result
 
+    carry_bytes: Bytes = itob(carry)[7]
+    return concat(carry_bytes, result)
+
+
+@subroutine
+def _add_digits(a_digits: Bytes, b_digits: Bytes) -> tuple[Bytes, UInt64]:
+    # Assume a_digits and b_digits are padded to the same multiple of BIGINT_BYTE_SIZE
+    BIGINT_BYTE_SIZE: UInt64 = UInt64(BIGINT_BYTE_SIZE_INT)
     n: UInt64 = a_digits.length // BIGINT_BYTE_SIZE
     result: Bytes = Bytes(b"")
     carry: UInt64 = UInt64(0)
@@ -59,11 +86,7 @@ def add(a: Bytes, b: Bytes) -> Bytes:
         result = concat(ab_carry_bytes[1:], result)
         carry = ab_carry_carry + sum_carry
 
-    if carry == 0:
-        return result
-
-    carry_bytes: Bytes = itob(carry)[7]
-    return concat(carry_bytes, result)
+    return result, carry
 
 
 @subroutine
@@ -93,16 +116,20 @@ def equal(a: Bytes, b: Bytes) -> bool:
     return padded_a == padded_b
 
 
-# Karatsuba algorithm by Anatoly Karatsuba
 @subroutine
 def multiply(x_in: Bytes, y_in: Bytes) -> Bytes:
     BIGINT_BYTE_SIZE: UInt64 = UInt64(BIGINT_BYTE_SIZE_INT)
     length: UInt64 = enclosing_multiple(
         max_value(x_in.length, y_in.length), BIGINT_BYTE_SIZE
     )
-    x: Bytes = pad(x_in, length)
-    y: Bytes = pad(y_in, length)
+    return _multiply_digits(pad(x_in, length), pad(y_in, length))
+
 
+# Karatsuba algorithm by Anatoly Karatsuba
+@subroutine
+def _multiply_digits(x: Bytes, y: Bytes) -> Bytes:
+    # Assume x and y are padded to the same multiple of BIGINT_BYTE_SIZE
+    BIGINT_BYTE_SIZE: UInt64 = UInt64(BIGINT_BYTE_SIZE_INT)
     n: UInt64 = x.length
     if n <= BIGINT_BYTE_SIZE:
         x_as_bigint: BigUInt = BigUInt.from_bytes(x)
@@ -130,16 +157,19 @@ def multiply(x_in: Bytes, y_in: Bytes) -> Bytes:
 @subroutine
 def _bytes_to_uint256_digits(num: Bytes) -> arc4.DynamicArray[UInt256]:
     UINT256_BYTE_SIZE: UInt64 = UInt64(UINT256_BYTE_SIZE_INT)
-    digits: arc4.DynamicArray[UInt256] = arc4.DynamicArray[UInt256]()
-    zero: UInt256 = UInt256.from_bytes(bzero(UINT256_BYTE_SIZE))
-    digits.append(zero)
-    padded: Bytes = pad_as_multiple(num, UINT256_BYTE_SIZE)
-    num_digits: UInt64 = padded.length // UINT256_BYTE_SIZE
-    for i in urange(num_digits):
-        digit_bytes: Bytes = extract(padded, i * UINT256_BYTE_SIZE, UINT256_BYTE_SIZE)
-        digit: UInt256 = UInt256.from_bytes(digit_bytes)
-        digits.append(digit)
-    return digits
+    # Leading zero digits would otherwise be taken as the most significant divisor digit
+    return _encode_uint256_digits(strip_leading_zero_digits(num, UINT256_BYTE_SIZE))
+
+
+@subroutine
+def _encode_uint256_digits(digits: Bytes) -> arc4.DynamicArray[UInt256]:
+    # Assume digits is padded to a multiple of UINT256_BYTE_SIZE, without leading zero digits
+    UINT256_BYTE_SIZE: UInt64 = UInt64(UINT256_BYTE_SIZE_INT)
+    num_digits: UInt64 = digits.length // UINT256_BYTE_SIZE + 1
+    # The ARC4 encoding is the uint16 digit count followed by the digits, with a leading zero digit
+    length_prefix: Bytes = extract(itob(num_digits), 6, 2)
+    encoded: Bytes = concat(length_prefix, concat(bzero(UINT256_BYTE_SIZE), digits))
+    return arc4.DynamicArray[UInt256].from_bytes(encoded)
 
 
 @subroutine
@@ -180,7 +210,7 @@ def _multiply_word(
 @subroutine
 def _divide_word(
     u_raw: arc4.DynamicArray[UInt256], v_digit: BigUInt, base: BigUInt
-) -> Bytes:
+) -> arc4.DynamicArray[UInt256]:
     r: BigUInt = BigUInt(0)
     for i in urange(u_raw.length):
         digit: BigUInt = BigUInt.from_bytes(u_raw[i].bytes)
@@ -188,8 +218,7 @@ def _divide_word(
         q_digit: BigUInt = p // v_digit
         u_raw[i] = biguint_to_digit(q_digit)
         r = p - q_digit * v_digit
-    q: Bytes = _uint256_digits_to_bytes(u_raw)
-    return q
+    return u_raw
 
 
 @subroutine
@@ -202,19 +231,7 @@ def less_than(a: Bytes, b: Bytes) -> bool:
     assert a_digits.length % BIGINT_BYTE_SIZE == 0, "a length must be multiple of width"
     assert b_digits.length % BIGINT_BYTE_SIZE == 0, "b length must be multiple of width"
 
-    n: UInt64 = a_digits.length // BIGINT_BYTE_SIZE
-    for i in urange(n):
-        a_digit: BigUInt = BigUInt.from_bytes(
-            extract(a_digits, i * BIGINT_BYTE_SIZE, BIGINT_BYTE_SIZE)
-        )
-        b_digit: BigUInt = BigUInt.from_bytes(
-            extract(b_digits, i * BIGINT_BYTE_SIZE, BIGINT_BYTE_SIZE)
-        )
-        if a_digit < b_digit:
-            return True
-        if a_digit > b_digit:
-            return False
-    return False
+    return _less_than_digits(a_digits, b_digits)
 
 
 @subroutine
@@ -227,6 +244,13 @@ def greater_than(a: Bytes, b: Bytes) -> bool:
     assert a_digits.length % BIGINT_BYTE_SIZE == 0, "a length must be multiple of width"
     assert b_digits.length % BIGINT_BYTE_SIZE == 0, "b length must be multiple of width"
 
+    return _less_than_digits(b_digits, a_digits)
+
+
+@subroutine
+def _less_than_digits(a_digits: Bytes, b_digits: Bytes) -> bool:
+    # Assume a_digits and b_digits are padded to the same multiple of BIGINT_BYTE_SIZE
+    BIGINT_BYTE_SIZE: UInt64 = UInt64(BIGINT_BYTE_SIZE_INT)
     n: UInt64 = a_digits.length // BIGINT_BYTE_SIZE
     for i in urange(n):
         a_digit: BigUInt = BigUInt.from_bytes(
@@ -235,31 +259,38 @@ def greater_than(a: Bytes, b: Bytes) -> bool:
         b_digit: BigUInt = BigUInt.from_bytes(
             extract(b_digits, i * BIGINT_BYTE_SIZE, BIGINT_BYTE_SIZE)
         )
-        if a_digit > b_digit:
-            return True
         if a_digit < b_digit:
+            return True
+        if a_digit > b_digit:
             return False
     return False
 
 
-# Algorithm D by Robert Knuth
 @subroutine
 def divide(u_num: Bytes, v_num: Bytes) -> Bytes:
     assert u_num.length >= 1, "u_num must have at least one byte"
     assert v_num.length >= 1, "v_num must have at least one byte"
     assert not equal(v_num, itob(0)), "Non-zero divisor"
 
-    BASE_UINT256: BigUInt = BigUInt(BASE_UINT256_INT)
-
     if less_than(u_num, v_num):
         # The divisor is larger than the dividend
         return itob(0)
     if equal(u_num, itob(0)):
         return itob(0)
 
-    u_raw: arc4.DynamicArray[UInt256] = _bytes_to_uint256_digits(u_num)
-    v_raw: arc4.DynamicArray[UInt256] = _bytes_to_uint256_digits(v_num)
+    q: arc4.DynamicArray[UInt256] = _divide_digits(
+        _bytes_to_uint256_digits(u_num), _bytes_to_uint256_digits(v_num)
+    )
+    return _uint256_digits_to_bytes(q)
 
+
+# Algorithm D by Robert Knuth
+@subroutine
+def _divide_digits(
+    u_raw: arc4.DynamicArray[UInt256], v_raw: arc4.DynamicArray[UInt256]
+) -> arc4.DynamicArray[UInt256]:
+    # Assume u >= v > 0, as 256 bit digits behind a single leading zero digit
+    BASE_UINT256: BigUInt = BigUInt(BASE_UINT256_INT)
     n: UInt64 = v_raw.length - 1
 
     assert n >= 1, "At least 1 digit divisor"
@@ -288,14 +319,13 @@ def divide(u_num: Bytes, v_num: Bytes) -> Bytes:
         qhat: BigUInt = qpart // v_1
         if u_j >= v_1:
             qhat = BASE_UINT256 - 1
+        rhat: BigUInt = qpart - qhat * v_1
 
         # Correct quotient estimate if too large
         u_j2: BigUInt = BigUInt.from_bytes(u[j + 2].bytes)
-        qhat_test: BigUInt = qhat * v_1 + ((qhat * v_2) // BASE_UINT256)
-        qhat_cond: BigUInt = qpart + (u_j2 // BASE_UINT256)
-        while qhat_test > qhat_cond:
+        while rhat < BASE_UINT256 and qhat * v_2 > BASE_UINT256 * rhat + u_j2:
             qhat -= 1
-            qhat_test = qhat * v_1 + ((qhat * v_2) // BASE_UINT256)
+            rhat += v_1
 
         # Step D4: Multiply and subtract
         c: BigUInt = BigUInt(0)
@@ -345,21 +375,33 @@ def divide(u_num: Bytes, v_num: Bytes) -> Bytes:
         if c > u_j and c_is_neg:
             # Step D6: Add back
             qhat -= 1
+            carry: BigUInt = BigUInt(0)
+            for i in reversed(urange(1, n + 1)):
+                u_ji_sum: BigUInt = (
+                    BigUInt.from_bytes(u[j + i].bytes)
+                    + BigUInt.from_bytes(v[i].bytes)
+                    + carry
+                )
+                u[j + i] = biguint_to_digit(u_ji_sum % BASE_UINT256)
+                carry = u_ji_sum // BASE_UINT256
 
         qhat_digit: UInt256 = biguint_to_digit(qhat)
         q.append(qhat_digit)
 
-    return _uint256_digits_to_bytes(q)
+    return q
 
 
 @subroutine
 def _calc_mod_barrett_reduce(a: Bytes, mod: Bytes, precomputed_factor: Bytes) -> Bytes:
     shift: UInt64 = mod.length * 2
     a_factor: Bytes = multiply(a, precomputed_factor)
-    q: Bytes = extract(a_factor, 0, a_factor.length - shift)
+    q: Bytes = itob(0)
+    if a_factor.length > shift:
+        q = extract(a_factor, 0, a_factor.length - shift)
     r: Bytes = subtract(a, multiply(q, mod))
     if not less_than(r, mod):
         r = subtract(r, mod)
+    r = pad(r, max_value(r.length, mod.length))
     return extract(r, r.length - mod.length, mod.length)
 
 
@@ -425,3 +467,78 @@ def modexp_barrett_reduce_post_validation(
             )
         base = _calc_mod_barrett_reduce(multiply(base, base), mod, precomputed_factor)
     return result
+
+
+# Integer square root by Newton's method
+@subroutine
+def isqrt(a: Bytes) -> Bytes:
+    BIGINT_BYTE_SIZE: UInt64 = UInt64(BIGINT_BYTE_SIZE_INT)
+    bits: UInt64 = bitlen(a)
+    if bits == 0:
+        return itob(0)
+    if a.length <= BIGINT_BYTE_SIZE:
+        return bsqrt(BigUInt.from_bytes(a)).bytes
+
+    # Seed with 2 ** ceil(bits / 2) >= sqrt(a), from which the iterates decrease to the root
+    two: Bytes = itob(2)
+    x: Bytes = power_of_two((bits + 1) // 2)
+    y: Bytes = divide(add(x, divide(a, x)), two)
+    while less_than(y, x):
+        x = y
+        y = divide(add(x, divide(a, x)), two)
+    return x
+
+
+# Integer nth root by Newton's method
+@subroutine
+def iroot(a: Bytes, n: UInt64) -> Bytes:
+    assert n >= 1, "Must have n >= 1"
+    if n == 2:
+        return isqrt(a)
+    bits: UInt64 = bitlen(a)
+    if bits == 0:
+        return itob(0)
+    if n >= bits:
+        # 1 <= a < 2 ** n, so the root is 1
+        return itob(1)
+    if n == 1:
+        return a
+
+    # Seed with 2 ** ceil(bits / n) >= a ** (1 / n), from which the iterates decrease to the root
+    x: Bytes = power_of_two((bits + n - 1) // n)
+    y: Bytes = _iroot_step(a, x, n)
+    while less_than(y, x):
+        x = y
+        y = _iroot_step(a, x, n)
+    return x
+
+
+@subroutine
+def _iroot_step(a: Bytes, x: Bytes, n: UInt64) -> Bytes:
+    # ((n - 1) * x + a // x ** (n - 1)) // n
+    x_pow: Bytes = _power(x, n - 1)
+    scaled_x: Bytes = multiply(itob(n - 1), x)
+    return divide(add(scaled_x, divide(a, x_pow)), itob(n))
+
+
+# Exponentiation by Squaring
+@subroutine
+def _power(base: Bytes, exp: UInt64) -> Bytes:
+    result: Bytes = itob(1)
+    while exp > 0:
+        if exp % 2 == 1:
+            result = multiply(result, base)
+        exp = exp // 2
+        if exp > 0:
+            base = multiply(base, base)
+    return result
+
+
+@subroutine
+def verify_isqrt(a: Bytes, r: Bytes) -> bool:
+    # r is the root iff r ** 2 <= a < (r + 1) ** 2 = r ** 2 + 2 * r + 1
+    r_squared: Bytes = multiply(r, r)
+    if greater_than(r_squared, a):
+        return False
+    next_squared: Bytes = add(add(r_squared, add(r, r)), itob(1))
+    return less_than(a, next_squared)
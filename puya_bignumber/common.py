@@ -1,5 +1,5 @@
 from algopy import Bytes, subroutine, UInt64
-from algopy.op import substring, bzero, concat
+from algopy.op import substring, bzero, concat, extract, itob
 
 
 @subroutine
@@ -28,6 +28,22 @@ def pad_as_multiple(value: Bytes, multiple: UInt64) -> Bytes:
     return pad(value, enclosing_multiple(value.length, multiple))
 
 
+@subroutine
+def strip_leading_zero_digits(value: Bytes, width: UInt64) -> Bytes:
+    padded: Bytes = pad_as_multiple(value, width)
+    zero_digit: Bytes = bzero(width)
+    while padded.length > width and extract(padded, 0, width) == zero_digit:
+        padded = substring(padded, width, padded.length)
+    return padded
+
+
+@subroutine
+def power_of_two(exponent: UInt64) -> Bytes:
+    leading_bit: UInt64 = UInt64(1) << (exponent % 8)
+    leading_byte: Bytes = extract(itob(leading_bit), 7, 1)
+    return concat(leading_byte, bzero(exponent // 8))
+
+
 @subroutine
 def min_value(a: UInt64, b: UInt64) -> UInt64:
     if a <= b:
@@ -0,0 +1,887 @@
+# Off-chain opcode budget estimator. Pure Python, so clients can size app call budget pools
+# without algopy. Not compiled by Puya.
+#
+# Each _<subroutine> function below mirrors the control flow of the subroutine of the same name
+# over operand byte lengths, taking the most expensive branch where the path depends on values.
+# It returns the ops executed, as counted by puya_bignumber.profiler, and an upper bound on the
+# byte length of the result. The ops are priced with the AVM opcode costs, plus the stack, constant
+# and branch opcodes the compiled program executes alongside them.
+import functools
+import math
+import typing
+from collections import Counter
+from dataclasses import dataclass, field
+
+__all__ = [
+    "estimate_cost",
+    "Estimate",
+    "trace_ops",
+    "SUPPORTED_OPS",
+    "OPCODE_COSTS",
+    "STACK_OPS_PER_OP",
+    "CALL_OVERHEAD",
+]
+
+BIGINT_BYTE_SIZE: int = 64
+UINT256_BYTE_SIZE: int = 32
+UINT64_BYTE_SIZE: int = 8
+
+# Inclusive bounds on a value
+Range: typing.TypeAlias = tuple[int, int]
+
+# AVM opcode costs that differ from 1
+OPCODE_COSTS: dict[str, int] = {
+    "b+": 10,
+    "b-": 10,
+    "b*": 20,
+    "b/": 20,
+    "b%": 20,
+    "b&": 6,
+    "b|": 6,
+    "b^": 6,
+    "b~": 4,
+    "bsqrt": 40,
+}
+
+# Fitted by `python -m tests.calibrate_cost --teal`, which runs the BignumberTester compiled by
+# puyapy at -O2 on the tests/avm.py interpreter at AVM opcode costs, not on a node. The fit gave
+# 1.98 stack ops per op and 4.28 per call, rounded up until every sample was bounded.
+STACK_OPS_PER_OP: int = 2
+CALL_OVERHEAD: int = 9
+
+
+@dataclass
+class Estimate:
+    """
+    Ops executed by an operator and the number of subroutine calls made.
+    """
+
+    ops: Counter[str] = field(default_factory=Counter)
+    calls: int = 0
+
+    def __add__(self, other: "Estimate") -> "Estimate":
+        return Estimate(self.ops + other.ops, self.calls + other.calls)
+
+    def __mul__(self, times: int) -> "Estimate":
+        return Estimate(
+            Counter({name: count * times for name, count in self.ops.items()}),
+            self.calls * times,
+        )
+
+    def cost(
+        self,
+        stack_ops_per_op: int = STACK_OPS_PER_OP,
+        call_overhead: int = CALL_OVERHEAD,
+    ) -> int:
+        op_cost: int = sum(
+            count * (OPCODE_COSTS.get(name, 1) + stack_ops_per_op)
+            for name, count in self.ops.items()
+        )
+        return op_cost + self.calls * call_overhead
+
+
+def _body(**ops: int) -> Estimate:
+    # The ops of a subroutine body, counting the call itself
+    return Estimate(Counter(ops), 1)
+
+
+def _ops(**ops: int) -> Estimate:
+    # The ops of a loop iteration or branch
+    return Estimate(Counter(ops), 0)
+
+
+def _enclosing_multiple(num: int, multiple: int) -> int:
+    return num + (multiple - num % multiple) % multiple
+
+
+def _largest(length: int) -> int:
+    return 256**length - 1
+
+
+def _operand(length: int) -> Range:
+    # Values of exactly length bytes, without leading zero bytes
+    return 256 ** (length - 1), _largest(length)
+
+
+def _length(bound: int) -> int:
+    return (bound.bit_length() + 7) // 8
+
+
+def _digits(length: int, width: int) -> int:
+    return _enclosing_multiple(length, width) // width
+
+
+# common
+
+
+def _pad() -> Estimate:
+    return _body(len=2, **{"<=": 1, "-": 1}, bzero=1, concat=1)
+
+
+def _enclosing() -> Estimate:
+    return _body(**{"%": 2, "-": 1, "+": 1})
+
+
+def _max_value() -> Estimate:
+    return _body(**{">=": 1})
+
+
+def _pad_as_multiple() -> Estimate:
+    return _body(len=1) + _enclosing() + _pad()
+
+
+def _strip_leading_zero_digits(zero_digits: int) -> Estimate:
+    check: Estimate = _ops(len=1, **{">": 1}, extract=1, **{"==": 1})
+    strip: Estimate = _ops(len=2, substring=1)
+    return (
+        _body(bzero=1)
+        + _pad_as_multiple()
+        + check * (zero_digits + 1)
+        + strip * zero_digits
+    )
+
+
+def _power_of_two() -> Estimate:
+    return _body(**{"%": 1, "shl": 1, "/": 1}, itob=1, extract=1, bzero=1, concat=1)
+
+
+# bignumber
+
+
+def _add_digits(n: int) -> Estimate:
+    digit: Estimate = _ops(**{"*": 2, "+": 3}, extract=6, btoi=2, concat=1, **{"b+": 2})
+    return _body(len=1, **{"/": 1}) + (digit + _pad() * 2) * n
+
+
+def _add(
+    a_length: int, b_length: int, bound: int | None = None
+) -> tuple[Estimate, int]:
+    # bound is the largest possible sum, which decides whether the carry digit is emitted
+    n: int = _digits(max(a_length, b_length), BIGINT_BYTE_SIZE)
+    if bound is None:
+        bound = _largest(a_length) + _largest(b_length)
+    estimate: Estimate = (
+        _body(len=2, **{"==": 1}, itob=1, extract=1, concat=1)
+        + _max_value()
+        + _enclosing()
+        + _pad() * 2
+        + _add_digits(n)
+    )
+    return estimate, n * BIGINT_BYTE_SIZE + (bound > _largest(n * BIGINT_BYTE_SIZE))
+
+
+def _subtract(
+    a_length: int, b_length: int, b_bound: int | None = None
+) -> tuple[Estimate, int]:
+    if b_bound == 0:
+        return _body(len=4, **{"==": 4}, bzero=2), a_length
+    length: int = _enclosing_multiple(max(a_length, b_length), BIGINT_BYTE_SIZE)
+    # b != 0 on this path, so the two's complement never carries
+    twos_complement, _ = _add(length, UINT64_BYTE_SIZE)
+    a_inv_b, _ = _add(length, length)
+    estimate: Estimate = (
+        _body(len=6, **{"==": 4}, bzero=2, **{"b~": 1}, itob=1, extract=1)
+        + _max_value()
+        + _enclosing()
+        + _pad() * 2
+        + twos_complement
+        + a_inv_b
+    )
+    return estimate, length
+
+
+def _equal() -> Estimate:
+    return _body(len=2, **{"==": 1}) + _max_value() + _pad() * 2
+
+
+def _less_than_digits(n: int) -> Estimate:
+    digit: Estimate = _ops(**{"*": 2}, extract=2, **{"b<": 1, "b>": 1})
+    return _body(len=1, **{"/": 1}) + digit * n
+
+
+def _less_than(a_length: int, b_length: int) -> Estimate:
+    n: int = _digits(max(a_length, b_length), BIGINT_BYTE_SIZE)
+    return (
+        _body(len=4, **{"%": 2, "==": 2})
+        + _max_value()
+        + _enclosing()
+        + _pad() * 2
+        + _less_than_digits(n)
+    )
+
+
+def _costlier(a: tuple[Estimate, int], b: tuple[Estimate, int]) -> tuple[Estimate, int]:
+    estimate: Estimate = a[0] if a[0].cost() >= b[0].cost() else b[0]
+    return estimate, max(a[1], b[1])
+
+
+def _multiply(
+    x_length: int,
+    y_length: int,
+    x_range: Range | None = None,
+    y_range: Range | None = None,
+    product_bound: int | None = None,
+) -> tuple[Estimate, int]:
+    # product_bound caps the product where the operand ranges are correlated
+    n: int = _enclosing_multiple(max(x_length, y_length), BIGINT_BYTE_SIZE)
+    x: Range = (0, _largest(x_length)) if x_range is None else x_range
+    y: Range = (0, _largest(y_length)) if y_range is None else y_range
+    bound: int = x[1] * y[1]
+    if product_bound is not None:
+        bound = min(bound, product_bound)
+    return _multiply_padded(n, x, y, bound)
+
+
+def _halves(value: Range, low_length: int) -> tuple[Range, Range, Range]:
+    # The ranges of the high and low halves of values in range, and of their sum
+    base: int = 256**low_length
+    high: Range = (value[0] // base, value[1] // base)
+    if high[0] == high[1]:
+        low: Range = (value[0] % base, value[1] % base)
+        return high, low, (high[0] + low[0], high[1] + low[1])
+    # The sum is largest just below a multiple of base, or at the upper end
+    top_high, top_low = divmod(value[1], base)
+    top: int = max(top_high + top_low, top_high - 1 + base - 1)
+    return high, (0, base - 1), (high[0], top)
+
+
+def _sum_cases(value: Range, n: int) -> list[Range]:
+    # A sum of halves is one digit longer when it carries, so split ranges that may carry
+    carry: int = 256 ** (_digits(n, BIGINT_BYTE_SIZE) * BIGINT_BYTE_SIZE)
+    if value[0] < carry <= value[1]:
+        return [(value[0], carry - 1), (carry, value[1])]
+    return [value]
+
+
+@functools.cache
+def _multiply_padded(n: int, x: Range, y: Range, bound: int) -> tuple[Estimate, int]:
+    # multiply pads the operands for _multiply_digits
+    setup: Estimate = _body() + _max_value() + _enclosing() + _pad() * 2
+    if n <= BIGINT_BYTE_SIZE:
+        return setup + _body(len=3, **{"<=": 1, "b*": 1}), _length(bound)
+
+    first_half: int = n // 2
+    second_half: int = n - first_half
+    shift: int = 256**second_half
+    x_left, x_right, x_sums = _halves(x, second_half)
+    y_left, y_right, y_sums = _halves(y, second_half)
+    p_1_bound: int = min(x_left[1] * y_left[1], bound // shift**2)
+    p_2_bound: int = x_right[1] * y_right[1]
+    p_4_bound: int = min(
+        x_left[1] * y_right[1] + x_right[1] * y_left[1], bound // shift
+    )
+    p_1, p_1_length = _multiply(first_half, first_half, x_left, y_left, p_1_bound)
+    p_2, p_2_length = _multiply(second_half, second_half, x_right, y_right)
+    setup += (
+        _body(len=3, **{"<=": 1, "/": 1, "-": 1, "*": 1}, extract=4, bzero=2, concat=2)
+        + p_1
+        + p_2
+    )
+
+    worst: tuple[Estimate, int] = (Estimate(), 0)
+    for x_sum in _sum_cases(x_sums, second_half):
+        for y_sum in _sum_cases(y_sums, second_half):
+            x_add, x_sum_length = _add(first_half, second_half, x_sum[1])
+            y_add, y_sum_length = _add(first_half, second_half, y_sum[1])
+            p_3, p_3_length = _multiply(x_sum_length, y_sum_length, x_sum, y_sum)
+            p_31, p_31_length = _subtract(p_3_length, p_1_length, p_1_bound)
+            p_4, p_4_length = _subtract(p_31_length, p_2_length, p_2_bound)
+            shifted_sum, shifted_sum_length = _add(
+                p_1_length + 2 * second_half,
+                p_4_length + second_half,
+                min(p_1_bound * shift**2 + p_4_bound * shift, bound),
+            )
+            result, result_length = _add(shifted_sum_length, p_2_length, bound)
+            worst = _costlier(
+                worst,
+                (
+                    setup + x_add + y_add + p_3 + p_31 + p_4 + shifted_sum + result,
+                    result_length,
+                ),
+            )
+    return worst
+
+
+def _bytes_to_uint256_digits(length: int, zero_digits: int = 0) -> tuple[Estimate, int]:
+    estimate: Estimate = (
+        _body() + _encode_uint256_digits() + _strip_leading_zero_digits(zero_digits)
+    )
+    return estimate, _digits(length, UINT256_BYTE_SIZE) - zero_digits + 1
+
+
+def _encode_uint256_digits() -> Estimate:
+    return _body(len=1, **{"/": 1, "+": 1}, itob=1, extract=1, concat=2, bzero=1)
+
+
+def _uint256_digits_to_bytes() -> Estimate:
+    return _body() + _body(len=1, substring=1)
+
+
+def _biguint_to_digit() -> Estimate:
+    return _body(len=3, **{"==": 1, "-": 1}, substring=1) + _pad_as_multiple()
+
+
+def _multiply_word(n: int) -> Estimate:
+    digit: Estimate = _ops(extract=1, replace=1, **{"b*": 1, "b+": 1, "b%": 1, "b/": 1})
+    return (
+        _body(**{"+": 1}, replace=1)
+        + _biguint_to_digit()
+        + (digit + _biguint_to_digit()) * n
+    )
+
+
+def _divide_word(n: int) -> Estimate:
+    digit: Estimate = _ops(extract=1, replace=1, **{"b*": 2, "b+": 1, "b/": 1, "b-": 1})
+    return _body(len=1) + (digit + _biguint_to_digit()) * n
+
+
+def _divide(
+    u_length: int, v_length: int, u_zero_digits: int = 0, v_zero_digits: int = 0
+) -> tuple[Estimate, int]:
+    # Zero digits are leading zero 32 byte digits, which do not count towards the magnitude
+    checks: Estimate = (
+        _body(len=2, **{">=": 2}, itob=1) + _equal() + _less_than(u_length, v_length)
+    )
+    if (
+        u_length - u_zero_digits * UINT256_BYTE_SIZE
+        < v_length - v_zero_digits * UINT256_BYTE_SIZE
+    ):
+        return checks, UINT64_BYTE_SIZE
+
+    u_convert, u_digits = _bytes_to_uint256_digits(u_length, u_zero_digits)
+    v_convert, v_digits = _bytes_to_uint256_digits(v_length, v_zero_digits)
+    n: int = v_digits - 1
+    m: int = max(u_digits - v_digits, 0)
+    estimate: Estimate = (
+        checks
+        + _ops(len=3, **{">=": 1, "-": 2, "==": 1}, itob=1, extract=1)
+        + _equal()
+        + u_convert
+        + v_convert
+        + _body()
+        + _uint256_digits_to_bytes()
+    )
+    if n <= 1:
+        return estimate + _divide_word(u_digits), u_digits * UINT256_BYTE_SIZE
+
+    qhat_check: Estimate = _ops(**{"b<": 1, "b*": 2, "b+": 1, "b>": 1})
+    qhat_correct: Estimate = qhat_check + _ops(**{"b-": 1, "b+": 1})
+    estimate_qhat: Estimate = (
+        _ops(**{"+": 2}, extract=3, **{"b*": 2, "b+": 1, "b/": 1, "b>=": 1, "b-": 2})
+        + qhat_check
+    )
+    # Most expensive of the four signed multiply and subtract branches
+    multiply_subtract: Estimate = (
+        _ops(
+            **{"+": 2},
+            extract=2,
+            replace=1,
+            **{"b*": 2, "b+": 3, "b-": 2, "b%": 2, "b/": 1, "b>=": 1, "b==": 1},
+        )
+        + _biguint_to_digit()
+    )
+    add_back: Estimate = (
+        _ops(**{"+": 2}, extract=2, replace=1, **{"b+": 2, "b%": 1, "b/": 1})
+        + _biguint_to_digit()
+    )
+    # qhat starts at most 2 above the quotient digit, and each correction and the add back
+    # (Step D6) lower it by 1, so a step pays for at most two of them. With two divisor
+    # digits the corrected qhat is exact and never added back.
+    over_estimate: Estimate = qhat_correct * 2
+    if n > 2:
+        add_back_step: Estimate = qhat_correct + add_back * n
+        if add_back_step.cost() > over_estimate.cost():
+            over_estimate = add_back_step
+    step: Estimate = (
+        estimate_qhat
+        + over_estimate
+        + _ops(**{"+": 2, "b>": 1, "b-": 1}, concat=1)
+        + multiply_subtract * n
+        + _biguint_to_digit()
+    )
+    estimate += (
+        _ops(**{"+": 2}, extract=2, **{"b+": 1, "b/": 1})
+        + _multiply_word(m + n)
+        + _multiply_word(n)
+        + step * (m + 1)
+    )
+    return estimate, (m + 1) * UINT256_BYTE_SIZE
+
+
+def _calc_mod_barrett_reduce(a: Range, mod: Range, factor: Range) -> Estimate:
+    # For the factor of mod, a * factor < mod * 2 ** (16 * mod.length), so q < mod
+    mod_length: int = _length(mod[1])
+    a_length: int = _length(a[1])
+    shift: int = 256 ** (2 * mod_length)
+    a_factor, a_factor_length = _multiply(
+        a_length, _length(factor[1]), a, factor, mod[1] * shift
+    )
+    q_length: int = max(a_factor_length - 2 * mod_length, UINT64_BYTE_SIZE)
+    q: Range = (0, min(a[1] * factor[1], mod[1] * shift) // shift)
+    q_mod, q_mod_length = _multiply(q_length, mod_length, q, mod, a[1])
+    r, r_length = _subtract(a_length, q_mod_length)
+    r_mod, _ = _subtract(r_length, mod_length)
+    return (
+        _body(len=8, **{"*": 1, ">": 1, "-": 2}, itob=1, extract=2)
+        + a_factor
+        + q_mod
+        + r
+        + _less_than(r_length, mod_length)
+        + r_mod
+        + _max_value()
+        + _pad()
+    )
+
+
+def _barrett_assumption_validation(a_length: int, mod_length: int) -> Estimate:
+    mod: Range = _operand(mod_length)
+    mod_squared, mod_squared_length = _multiply(mod_length, mod_length, mod, mod)
+    mod_minus_one, _ = _subtract(mod_length, UINT64_BYTE_SIZE)
+    return (
+        _body(itob=3, **{"b&": 1})
+        + mod_squared
+        + _less_than(a_length, mod_squared_length)
+        + _equal() * 2
+        + mod_minus_one
+    )
+
+
+def _barrett_reducer_factor(mod_length: int) -> Estimate:
+    return (
+        _body(itob=4, **{"b&": 1, "*": 1}, len=1, extract=1, bzero=1, concat=1)
+        + _equal() * 2
+        + _subtract(mod_length, UINT64_BYTE_SIZE)[0]
+        + _divide(2 * mod_length + 1, mod_length)[0]
+    )
+
+
+def _barrett_cases(
+    a_length: int, mod_length: int, factor_length: int | None
+) -> typing.Iterator[tuple[Range, Range, Range]]:
+    # a and the factor are bounded by mod from opposite sides, so bound them for each bit length
+    # of mod rather than over the whole length
+    shift: int = 256 ** (2 * mod_length)
+    for bits in range(8 * mod_length - 7, 8 * mod_length + 1):
+        mod: Range = (2 ** (bits - 1), 2**bits - 1)
+        a: Range = (0, min(_largest(a_length), mod[1] ** 2 - 1))
+        factor: Range = (shift // mod[1], shift // mod[0])
+        if factor_length is not None and factor_length != _length(factor[1]):
+            # Not the factor of a mod without leading zero bytes
+            factor = _operand(factor_length)
+        yield a, mod, factor
+
+
+def _mod_barrett_reduce(
+    a_length: int, mod_length: int, factor_length: int | None = None
+) -> Estimate:
+    reduce: Estimate = max(
+        (
+            _calc_mod_barrett_reduce(a, mod, factor)
+            for a, mod, factor in _barrett_cases(a_length, mod_length, factor_length)
+        ),
+        key=Estimate.cost,
+    )
+    return _body() + _barrett_assumption_validation(a_length, mod_length) + reduce
+
+
+def _modexp_bits(a: Range, mod: Range, factor: Range) -> tuple[Estimate, Estimate]:
+    # Residues are mod.length bytes, and the initial result is itob(1)
+    residue: Range = (0, mod[1] - 1)
+    residue_length: int = max(_length(mod[1]), UINT64_BYTE_SIZE)
+    product, _ = _multiply(residue_length, residue_length, residue, residue)
+    reduce: Estimate = _calc_mod_barrett_reduce((0, residue[1] ** 2), mod, factor)
+    # Every exponent bit set is the most expensive path
+    bit: Estimate = _ops(getbit=1, **{"==": 1}) + (product + reduce) * 2
+    return _calc_mod_barrett_reduce(a, mod, factor), bit
+
+
+def _modexp_barrett_reduce(
+    base_length: int,
+    exp_length: int,
+    mod_length: int,
+    factor_length: int | None = None,
+) -> Estimate:
+    reduce: Estimate = max(
+        (
+            first + bit * (8 * exp_length)
+            for first, bit in (
+                _modexp_bits(*case)
+                for case in _barrett_cases(base_length, mod_length, factor_length)
+            )
+        ),
+        key=Estimate.cost,
+    )
+    return (
+        _body() * 2
+        + _barrett_assumption_validation(base_length, mod_length)
+        + _body(itob=1, len=1, **{"*": 1})
+        + reduce
+    )
+
+
+def _newton_steps(bits: int, n: int) -> int:
+    # The seed 2 ** ceil(bits / n) is at most twice the root, and the integer iterates never exceed
+    # the real Newton iterates from it. Those shrink the relative error e by about (n - 1) / n per
+    # step, then to at most (n - 1) / 2 * e ** 2. Once e < 2 ** -ceil(bits / n) the iterate is
+    # within 1 of the root, so one step reaches it and one more stops.
+    root_bits: int = -(-bits // n)
+    ratio: float = 2.0
+    steps: int = 0
+    while ratio - 1 > 2**-20:
+        ratio = ((n - 1) * ratio + ratio ** (1 - n)) / n
+        steps += 1
+    log_error: float = math.log2(ratio - 1)
+    while log_error > -root_bits:
+        log_error = 2 * log_error + math.log2(n / 2)
+        steps += 1
+    return steps + 2
+
+
+def _divide_by_root(
+    u_length: int, v_length: int, v_magnitudes: Range
+) -> tuple[Estimate, int]:
+    # Divide by a value carrying leading zero digits, taking the costliest of its magnitudes
+    worst: tuple[Estimate, int] = (Estimate(), 0)
+    for v_digits in range(
+        _digits(v_magnitudes[0], UINT256_BYTE_SIZE),
+        _digits(v_magnitudes[1], UINT256_BYTE_SIZE) + 1,
+    ):
+        zero_digits: int = _digits(v_length, UINT256_BYTE_SIZE) - v_digits
+        worst = _costlier(worst, _divide(u_length, v_length, 0, max(zero_digits, 0)))
+    return worst
+
+
+def _newton_step(a_length: int, n: int, x_length: int) -> tuple[Estimate, int]:
+    # Iterates lie between the root and the seed, and are padded to 32 byte digits by divide
+    bits: int = 8 * a_length
+    seed: int = 2 ** -(-bits // n)
+    root: int = 2 ** ((bits - 1) // n)
+    x: Range = (root, seed)
+    if n == 2:
+        estimate: Estimate = Estimate()
+        scaled_length: int = x_length
+        x_pow_length: int = x_length
+        x_pow: Range = x
+    else:
+        estimate, x_pow_length = _power(x_length, n - 1, x)
+        x_pow = (root ** (n - 1), seed ** (n - 1))
+        scaled, scaled_length = _multiply(UINT64_BYTE_SIZE, x_length, (n - 1, n - 1), x)
+        estimate += _body(**{"-": 2}, itob=2) + scaled
+    quotient, quotient_length = _divide_by_root(
+        a_length, x_pow_length, (_length(x_pow[0]), _length(x_pow[1]))
+    )
+    total: int = (n - 1) * seed + _largest(a_length) // x_pow[0]
+    add, sum_length = _add(scaled_length, quotient_length, total)
+    sum_zero_digits: int = _digits(sum_length, UINT256_BYTE_SIZE) - _digits(
+        _length(total), UINT256_BYTE_SIZE
+    )
+    halve, y_length = _divide(sum_length, UINT64_BYTE_SIZE, sum_zero_digits)
+    estimate += quotient + add + halve + _less_than(y_length, x_length)
+    return estimate, y_length
+
+
+def _newton(a_length: int, n: int) -> Estimate:
+    bits: int = 8 * a_length
+    x_length: int = _length(2 ** -(-bits // n))
+    estimate: Estimate = _power_of_two()
+    for _ in range(_newton_steps(bits, n)):
+        step, x_length = _newton_step(a_length, n, x_length)
+        estimate += step
+    return estimate
+
+
+def _isqrt(a_length: int) -> Estimate:
+    estimate: Estimate = _body(bitlen=1, len=1, **{"==": 1, "<=": 1})
+    if a_length <= BIGINT_BYTE_SIZE:
+        return estimate + _ops(bsqrt=1)
+    return estimate + _ops(itob=1, **{"+": 1, "/": 1}) + _newton(a_length, 2)
+
+
+def _power(base_length: int, exp: int, base: Range) -> tuple[Estimate, int]:
+    estimate: Estimate = _body(itob=1, **{">": 1})
+    result: Range = (1, 1)
+    result_length: int = UINT64_BYTE_SIZE
+    while exp > 0:
+        estimate += _ops(**{">": 2, "%": 1, "==": 1, "/": 1})
+        if exp % 2 == 1:
+            product, result_length = _multiply(result_length, base_length, result, base)
+            result = (result[0] * base[0], result[1] * base[1])
+            estimate += product
+        exp //= 2
+        if exp > 0:
+            square, base_length = _multiply(base_length, base_length, base, base)
+            base = (base[0] ** 2, base[1] ** 2)
+            estimate += square
+    return estimate, result_length
+
+
+def _iroot(a_length: int, n: int) -> Estimate:
+    if n < 1:
+        raise ValueError("iroot degree must be at least 1")
+    if n == 2:
+        return _body(**{">=": 1, "==": 1}) + _isqrt(a_length)
+    estimate: Estimate = _body(**{">=": 1, "==": 2}, bitlen=1)
+    if n >= 8 * a_length:
+        # Every a of a_length bytes has at most n bits, so the root is 0 or 1
+        return estimate + _ops(**{"==": 1, ">=": 1}, itob=1)
+    estimate += _ops(**{"==": 1, ">=": 1})
+    if n == 1:
+        return estimate
+    steps: int = _newton_steps(8 * a_length, n)
+    return (
+        estimate
+        + _ops(**{"+": 1, "-": 1, "/": 1})
+        + _body() * steps
+        + _newton(a_length, n)
+    )
+
+
+def _verify_isqrt(a_length: int, r_length: int) -> Estimate:
+    r_squared, r_squared_length = _multiply(r_length, r_length)
+    r_doubled, r_doubled_length = _add(r_length, r_length)
+    partial, partial_length = _add(r_squared_length, r_doubled_length)
+    next_squared, next_squared_length = _add(partial_length, UINT64_BYTE_SIZE)
+    return (
+        _body(itob=1)
+        + r_squared
+        + _less_than(r_squared_length, a_length)
+        + r_doubled
+        + partial
+        + next_squared
+        + _less_than(a_length, next_squared_length)
+    )
+
+
+# curve
+#
+# Only fields of up to 256 bits are traced, where the field ops reduce with the native byte
+# math. The shipped curves all take that path.
+
+WINDOW_BITS: int = 4
+WINDOW_MASK: int = 15
+
+
+def _fit() -> Estimate:
+    return _body(len=2, **{"-": 1}, extract=1) + _max_value() + _pad()
+
+
+def _mod_multiply() -> Estimate:
+    return _body(len=2, **{"*": 1, "<=": 1, "b*": 1, "b%": 1}, bzero=1, **{"b|": 1})
+
+
+def _mod_power(exp_length: int) -> Estimate:
+    # Every exponent bit set is the most expensive path
+    bit: Estimate = _ops(**{"b*": 2, "b%": 2}, getbit=1, **{"==": 1})
+    return _body(len=3, **{"*": 2, ">": 1}, bzero=1, **{"b|": 1}) + bit * (
+        8 * exp_length
+    )
+
+
+def _field_add() -> Estimate:
+    return _body(len=2, **{"<": 1, "b+": 1, "b>=": 1, "b-": 1}, bzero=1, **{"b|": 1})
+
+
+def _point_at_infinity() -> Estimate:
+    return _body(itob=1, len=2, bzero=1) + _fit()
+
+
+def _is_point_at_infinity() -> Estimate:
+    return _body(len=1, bzero=1, **{"==": 1})
+
+
+def _to_jacobian(p_length: int) -> Estimate:
+    return _body(len=1, itob=1) + _less_than(p_length, p_length) * 2 + _fit() * 3
+
+
+def _is_on_curve(p_length: int) -> Estimate:
+    return (
+        _body(len=2, **{"==": 1})
+        + _less_than(p_length, p_length) * 2
+        + _fit() * 2
+        + _mod_multiply() * 3
+        + _field_add() * 2
+    )
+
+
+def _native_point() -> Estimate:
+    return _body(bzero=1, **{"b|": 3})
+
+
+def _native_point_double() -> Estimate:
+    # The general m for any a costs more than those for a = 0 and a = -3
+    return _body(**{"b*": 15, "b%": 12, "b+": 5, "b-": 3, "b==": 2})
+
+
+def _point_double() -> Estimate:
+    return (
+        _body(len=2, **{"*": 1, "<=": 1})
+        + _is_point_at_infinity()
+        + _native_point_double()
+        + _native_point()
+    )
+
+
+def _native_add_scaled() -> Estimate:
+    double: Estimate = _ops(**{"b==": 1}) + _point_double()
+    add: Estimate = (
+        _ops(len=1, **{"b*": 8, "b%": 8, "b+": 4, "b-": 4}) + _native_point()
+    )
+    return _body(**{"b+": 2, "b-": 2, "b%": 2, "b==": 1}) + max(
+        double, add, key=Estimate.cost
+    )
+
+
+def _point_add() -> Estimate:
+    return (
+        _body(len=1, **{"*": 1, "<=": 1, "b*": 9, "b%": 9})
+        + _is_point_at_infinity() * 2
+        + _native_add_scaled()
+    )
+
+
+def _point_add_affine() -> Estimate:
+    return (
+        _body(len=1, **{"*": 1, "<=": 1, "b*": 4, "b%": 4})
+        + _is_point_at_infinity()
+        + _native_add_scaled()
+    )
+
+
+def _window() -> Estimate:
+    return _body(getbyte=1, **{"/": 1, "%": 1, "==": 1, "shr": 1})
+
+
+def _table_point() -> Estimate:
+    return _body(len=1, **{"-": 1, "*": 3, "+": 2}, extract=3)
+
+
+def _window_table() -> Estimate:
+    even: Estimate = (
+        _ops(**{"%": 1, "==": 1, "/": 1}, concat=3) + _table_point() + _point_double()
+    )
+    odd: Estimate = _ops(**{"%": 1, "==": 1}, concat=3) + _point_add()
+    return _body(concat=2, **{"+": 1}) + (even + odd) * (WINDOW_MASK // 2)
+
+
+def _windowed_sum(scalar_length: int) -> Estimate:
+    # Every window digit nonzero is the most expensive path
+    window: Estimate = (
+        _point_double() * WINDOW_BITS
+        + _window() * 2
+        + _ops(**{"!=": 2, "-": 1, "*": 2, "+": 1}, extract=2)
+        + _point_add_affine()
+        + _table_point()
+        + _point_add()
+    )
+    return (
+        _body(len=3, **{"*": 1})
+        + _max_value()
+        + _pad() * 2
+        + _point_at_infinity()
+        + window * (2 * scalar_length)
+    )
+
+
+def _ecdsa_verify(
+    hash_length: int, p_length: int, n_length: int | None = None
+) -> Estimate:
+    # Assume the public key has the length of p and r, s that of n, by default the length of p.
+    # The group order n > p / 2 for curves of prime order, which leaves at most two candidates
+    # for the x coordinate below p.
+    if n_length is None:
+        n_length = p_length
+    if 2 * max(p_length, n_length) > BIGINT_BYTE_SIZE:
+        raise ValueError("ecdsa_verify is only traced for fields of up to 256 bits")
+    e_length: int = min(hash_length, n_length)
+    estimate: Estimate = (
+        _body(itob=2, len=5, **{"*": 1, ">": 1}, bitlen=1)
+        + _is_on_curve(p_length)
+        + (_equal() + _less_than(n_length, n_length)) * 2
+        + _fit() * 2
+    )
+    if hash_length >= n_length:
+        # The hash is truncated to the bits of n, which may not end on a byte
+        estimate += (
+            _ops(**{"+": 2, "/": 1, "*": 1, "-": 2, "!=": 1}, extract=2)
+            + _power_of_two()
+            + _multiply(e_length, 1)[0]
+            + _fit()
+        )
+    candidate_length: int = n_length
+    candidates: Estimate = Estimate()
+    for _ in range(2):
+        add, sum_length = _add(candidate_length, n_length)
+        candidates += (
+            _ops(len=1, **{"==": 1})
+            + _less_than(candidate_length, p_length)
+            + _fit()
+            + _mod_multiply()
+            + add
+        )
+        candidate_length = sum_length
+    return (
+        estimate
+        + _less_than(e_length, n_length)
+        + _subtract(e_length, n_length)[0]
+        + _fit() * 2
+        + _subtract(n_length, UINT64_BYTE_SIZE)[0]
+        + _mod_power(n_length)
+        + _mod_multiply() * 3
+        + _to_jacobian(p_length)
+        + _window_table()
+        + _windowed_sum(n_length)
+        + _is_point_at_infinity()
+        + candidates
+        + _less_than(candidate_length, p_length)
+    )
+
+
+_OPERATORS: dict[str, typing.Callable[..., Estimate]] = {
+    "add": lambda a, b: _add(a, b)[0],
+    "subtract": lambda a, b: _subtract(a, b)[0],
+    "equal": lambda a, b: _equal(),
+    "less_than": _less_than,
+    "greater_than": _less_than,
+    "multiply": lambda a, b: _multiply(a, b, _operand(a), _operand(b))[0],
+    "divide": lambda a, b: _divide(a, b)[0],
+    "barrett_reducer_factor": _barrett_reducer_factor,
+    "mod_barrett_reduce": _mod_barrett_reduce,
+    "modexp_barrett_reduce": _modexp_barrett_reduce,
+    "isqrt": _isqrt,
+    "iroot": _iroot,
+    "verify_isqrt": _verify_isqrt,
+    "ecdsa_verify": _ecdsa_verify,
+}
+
+SUPPORTED_OPS: tuple[str, ...] = tuple(_OPERATORS)
+
+
+def trace_ops(op: str, *lengths: int) -> Estimate:
+    """
+    The upper bound on ops executed by `op` for operands of the given byte lengths, before pricing.
+    """
+    if op not in _OPERATORS:
+        raise ValueError(f"Unknown op {op}, expected one of {', '.join(SUPPORTED_OPS)}")
+    if any(length < 1 for length in lengths):
+        raise ValueError("Operand lengths must be at least 1 byte")
+    return _OPERATORS[op](*lengths)
+
+
+def estimate_cost(op: str, *lengths: int) -> int:
+    """
+    Upper bound on the opcode budget consumed by an operator, for sizing app call budget pools.
+
+    The bound holds for any operand values of the given lengths, so is reached only by the costliest
+    values, e.g. all-0xFF operands whose digit sums carry, and every exponent bit set.
+
+    Lengths are the big-endian byte lengths of the operands without leading zero bytes, in the
+    order the operator takes them. The Barrett operators optionally take the precomputed factor
+    length last, by default that of barrett_reducer_factor(mod). iroot takes the degree in place of
+    a second length. ecdsa_verify takes the hash and field lengths, and optionally that of the group
+    order, for fields of up to 256 bits.
+
+    Args:
+    - op: The operator name, one of SUPPORTED_OPS.
+    - lengths: The operand byte lengths.
+    """
+    return trace_ops(op, *lengths).cost()
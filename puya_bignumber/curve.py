@@ -0,0 +1,749 @@
+from algopy import Bytes, subroutine, BigUInt, UInt64, urange
+from algopy.op import bzero, concat, extract, getbit, getbyte, itob, bitlen
+from .common import pad, max_value, power_of_two
+from .bignumber import (
+    BIGINT_BYTE_SIZE_INT,
+    _calc_mod_barrett_reduce,
+    add,
+    subtract,
+    equal,
+    multiply,
+    less_than,
+    modexp_barrett_reduce_post_validation,
+)
+import typing
+
+__all__ = [
+    "Curve",
+    "JacobianPoint",
+    "point_at_infinity",
+    "is_point_at_infinity",
+    "to_jacobian",
+    "to_affine",
+    "is_on_curve",
+    "point_double",
+    "point_add",
+    "point_add_affine",
+    "scalar_multiply",
+    "fixed_base_multiply",
+    "ecdsa_verify",
+    "secp256k1",
+    "secp256k1_generator_table",
+    "p256",
+    "p256_generator_table",
+    "bn254",
+    "bn254_generator_table",
+]
+
+# Scalars are read in 4 bit windows, two per byte, each selecting one of the 15 nonzero
+# multiples of the base point from a table
+WINDOW_BITS_INT: int = 4
+WINDOW_MASK_INT: int = 15
+
+
+# Short Weierstrass curve y ** 2 = x ** 3 + a * x + b over the prime field of p, with a
+# generator of prime order n. The factors are the Barrett factors of p and n, and a and b
+# are padded to the byte length of p.
+class Curve(typing.NamedTuple):
+    p: Bytes
+    p_factor: Bytes
+    a: Bytes
+    b: Bytes
+    n: Bytes
+    n_factor: Bytes
+
+
+# Point (x / z ** 2, y / z ** 3) in Jacobian coordinates, with z = 0 at infinity. The
+# coordinates are padded to the byte length of p. Additions and doublings need no modular
+# inverse, so only to_affine pays for one.
+class JacobianPoint(typing.NamedTuple):
+    x: Bytes
+    y: Bytes
+    z: Bytes
+
+
+@subroutine
+def _fit(value: Bytes, length: UInt64) -> Bytes:
+    # The last length bytes of value, assuming the rest are zero
+    padded: Bytes = pad(value, max_value(value.length, length))
+    return extract(padded, padded.length - length, length)
+
+
+@subroutine
+def _mod_multiply(a: Bytes, b: Bytes, mod: Bytes, factor: Bytes) -> Bytes:
+    # Assume a, b < mod. Products that fit the AVM byte math are reduced natively, wider
+    # ones by Barrett Reduction, which a * b < mod ** 2 satisfies. b| zero extends the
+    # shorter operand, so pads the residue to the length of mod without a subroutine call.
+    BIGINT_BYTE_SIZE: UInt64 = UInt64(BIGINT_BYTE_SIZE_INT)
+    if mod.length * 2 <= BIGINT_BYTE_SIZE:
+        product: BigUInt = BigUInt.from_bytes(a) * BigUInt.from_bytes(b)
+        return (product % BigUInt.from_bytes(mod)).bytes | bzero(mod.length)
+    return _calc_mod_barrett_reduce(multiply(a, b), mod, factor)
+
+
+# Modular Exponentiation by Squaring
+@subroutine
+def _mod_power(base: Bytes, exp: Bytes, mod: Bytes, factor: Bytes) -> Bytes:
+    # Assume base < mod
+    BIGINT_BYTE_SIZE: UInt64 = UInt64(BIGINT_BYTE_SIZE_INT)
+    if mod.length * 2 > BIGINT_BYTE_SIZE:
+        return modexp_barrett_reduce_post_validation(base, exp, mod, factor)
+    mod_int: BigUInt = BigUInt.from_bytes(mod)
+    base_int: BigUInt = BigUInt.from_bytes(base)
+    result: BigUInt = BigUInt(1)
+    for bit_i in urange(exp.length * 8):
+        result = (result * result) % mod_int
+        if getbit(exp, bit_i) == 1:
+            result = (result * base_int) % mod_int
+    return result.bytes | bzero(mod.length)
+
+
+@subroutine
+def _field_add(a: Bytes, b: Bytes, p: Bytes) -> Bytes:
+    # Assume a, b < p
+    BIGINT_BYTE_SIZE: UInt64 = UInt64(BIGINT_BYTE_SIZE_INT)
+    if p.length < BIGINT_BYTE_SIZE:
+        p_int: BigUInt = BigUInt.from_bytes(p)
+        sum: BigUInt = BigUInt.from_bytes(a) + BigUInt.from_bytes(b)
+        if sum >= p_int:
+            sum = sum - p_int
+        return sum.bytes | bzero(p.length)
+    result: Bytes = add(a, b)
+    if not less_than(result, p):
+        result = subtract(result, p)
+    return _fit(result, p.length)
+
+
+@subroutine
+def _field_double(a: Bytes, p: Bytes) -> Bytes:
+    return _field_add(a, a, p)
+
+
+@subroutine
+def _field_subtract(a: Bytes, b: Bytes, p: Bytes) -> Bytes:
+    # Assume a, b < p. Adding p to a keeps the difference positive
+    BIGINT_BYTE_SIZE: UInt64 = UInt64(BIGINT_BYTE_SIZE_INT)
+    if p.length < BIGINT_BYTE_SIZE:
+        a_int: BigUInt = BigUInt.from_bytes(a)
+        b_int: BigUInt = BigUInt.from_bytes(b)
+        if a_int < b_int:
+            a_int = a_int + BigUInt.from_bytes(p)
+        return (a_int - b_int).bytes | bzero(p.length)
+    if less_than(a, b):
+        a = add(a, p)
+    return _fit(subtract(a, b), p.length)
+
+
+@subroutine
+def point_at_infinity(curve: Curve) -> JacobianPoint:
+    one: Bytes = _fit(itob(1), curve.p.length)
+    return JacobianPoint(one, one, bzero(curve.p.length))
+
+
+@subroutine
+def is_point_at_infinity(point: JacobianPoint) -> bool:
+    return point.z == bzero(point.z.length)
+
+
+@subroutine
+def to_jacobian(x: Bytes, y: Bytes, curve: Curve) -> JacobianPoint:
+    assert less_than(x, curve.p), "Must have x < p"
+    assert less_than(y, curve.p), "Must have y < p"
+    length: UInt64 = curve.p.length
+    return JacobianPoint(_fit(x, length), _fit(y, length), _fit(itob(1), length))
+
+
+@subroutine
+def to_affine(point: JacobianPoint, curve: Curve) -> tuple[Bytes, Bytes]:
+    assert not is_point_at_infinity(point), "Point at infinity has no affine form"
+    p: Bytes = curve.p
+    factor: Bytes = curve.p_factor
+    # z ** (p - 2) is the inverse of z by Fermat's little theorem. The exponent is kept to
+    # the length of p, as every leading zero bit would cost a squaring.
+    exp: Bytes = _fit(subtract(p, itob(2)), p.length)
+    z_inverse: Bytes = _mod_power(point.z, exp, p, factor)
+    z_inverse_squared: Bytes = _mod_multiply(z_inverse, z_inverse, p, factor)
+    z_inverse_cubed: Bytes = _mod_multiply(z_inverse_squared, z_inverse, p, factor)
+    return (
+        _mod_multiply(point.x, z_inverse_squared, p, factor),
+        _mod_multiply(point.y, z_inverse_cubed, p, factor),
+    )
+
+
+@subroutine
+def is_on_curve(x: Bytes, y: Bytes, curve: Curve) -> bool:
+    p: Bytes = curve.p
+    factor: Bytes = curve.p_factor
+    if not less_than(x, p) or not less_than(y, p):
+        return False
+    x = _fit(x, p.length)
+    y = _fit(y, p.length)
+    # x ** 3 + a * x + b = (x ** 2 + a) * x + b
+    x_squared_a: Bytes = _field_add(_mod_multiply(x, x, p, factor), curve.a, p)
+    rhs: Bytes = _field_add(_mod_multiply(x_squared_a, x, p, factor), curve.b, p)
+    return _mod_multiply(y, y, p, factor) == rhs
+
+
+@subroutine
+def _native_point(x: BigUInt, y: BigUInt, z: BigUInt, length: UInt64) -> JacobianPoint:
+    zero: Bytes = bzero(length)
+    return JacobianPoint(x.bytes | zero, y.bytes | zero, z.bytes | zero)
+
+
+# Doubling over fields of up to 256 bits. With x, y, z < p < 2 ** 256, a product of two
+# coordinates plus a few multiples of p fits the 512 bit byte math, so each coordinate
+# takes a single b% in place of a field op call per term.
+@subroutine
+def _native_point_double(
+    x: BigUInt, y: BigUInt, z: BigUInt, a: BigUInt, p: BigUInt
+) -> tuple[BigUInt, BigUInt, BigUInt]:
+    y_squared: BigUInt = y * y % p
+    # s = 4 * x * y ** 2, kept as s / 4
+    s: BigUInt = x * y_squared % p
+    # m = 3 * x ** 2 + a * z ** 4, which is 3 * (x - z ** 2) * (x + z ** 2) where a = -3
+    # as for P-256
+    if a == 0:
+        m: BigUInt = x * x % p * 3 % p
+    else:
+        z_squared: BigUInt = z * z % p
+        if a + 3 == p:
+            m = (x + p - z_squared) * 3 % p * ((x + z_squared) % p) % p
+        else:
+            m = (x * x % p * 3 + a * (z_squared * z_squared % p)) % p
+
+    # x' = m ** 2 - 2 * s
+    x_doubled: BigUInt = (m * m + (p - s) * 8) % p
+    # y' = m * (s - x') - 8 * y ** 4
+    y_doubled: BigUInt = (
+        m * ((s * 4 + p - x_doubled) % p) + (p - y_squared * y_squared % p) * 8
+    ) % p
+    # z' = 2 * y * z
+    return x_doubled, y_doubled, y * z % p * 2 % p
+
+
+# Doubling in Jacobian coordinates by Cohen, Miyaji and Ono
+@subroutine
+def point_double(point: JacobianPoint, curve: Curve) -> JacobianPoint:
+    if is_point_at_infinity(point):
+        return point
+    BIGINT_BYTE_SIZE: UInt64 = UInt64(BIGINT_BYTE_SIZE_INT)
+    p: Bytes = curve.p
+    if p.length * 2 <= BIGINT_BYTE_SIZE:
+        x_int, y_int, z_int = _native_point_double(
+            BigUInt.from_bytes(point.x),
+            BigUInt.from_bytes(point.y),
+            BigUInt.from_bytes(point.z),
+            BigUInt.from_bytes(curve.a),
+            BigUInt.from_bytes(p),
+        )
+        return _native_point(x_int, y_int, z_int, p.length)
+
+    factor: Bytes = curve.p_factor
+    # s = 4 * x * y ** 2
+    y_squared: Bytes = _mod_multiply(point.y, point.y, p, factor)
+    s: Bytes = _field_double(
+        _field_double(_mod_multiply(point.x, y_squared, p, factor), p), p
+    )
+    # m = 3 * x ** 2 + a * z ** 4, where a = 0 for secp256k1 and BN254
+    x_squared: Bytes = _mod_multiply(point.x, point.x, p, factor)
+    m: Bytes = _field_add(_field_double(x_squared, p), x_squared, p)
+    if curve.a != bzero(curve.a.length):
+        z_squared: Bytes = _mod_multiply(point.z, point.z, p, factor)
+        z_fourth: Bytes = _mod_multiply(z_squared, z_squared, p, factor)
+        m = _field_add(m, _mod_multiply(curve.a, z_fourth, p, factor), p)
+
+    # x' = m ** 2 - 2 * s
+    x: Bytes = _field_subtract(_mod_multiply(m, m, p, factor), _field_double(s, p), p)
+    # y' = m * (s - x') - 8 * y ** 4
+    y_fourth: Bytes = _mod_multiply(y_squared, y_squared, p, factor)
+    y_fourth_8: Bytes = _field_double(_field_double(_field_double(y_fourth, p), p), p)
+    y: Bytes = _field_subtract(
+        _mod_multiply(m, _field_subtract(s, x, p), p, factor), y_fourth_8, p
+    )
+    # z' = 2 * y * z
+    z: Bytes = _field_double(_mod_multiply(point.y, point.z, p, factor), p)
+    return JacobianPoint(x, y, z)
+
+
+@subroutine
+def _add_scaled(
+    a: JacobianPoint,
+    u_1: Bytes,
+    s_1: Bytes,
+    u_2: Bytes,
+    s_2: Bytes,
+    z_1_z_2: Bytes,
+    curve: Curve,
+) -> JacobianPoint:
+    # Adds a and b given as u_i = x_i * z_j ** 2 and s_i = y_i * z_j ** 3, over a common
+    # denominator with z = z_1 * z_2
+    p: Bytes = curve.p
+    factor: Bytes = curve.p_factor
+    h: Bytes = _field_subtract(u_2, u_1, p)
+    r: Bytes = _field_subtract(s_2, s_1, p)
+    zero: Bytes = bzero(p.length)
+    if h == zero:
+        if r == zero:
+            # a == b
+            return point_double(a, curve)
+        # a == -b
+        return point_at_infinity(curve)
+
+    # x' = r ** 2 - h ** 3 - 2 * u_1 * h ** 2
+    h_squared: Bytes = _mod_multiply(h, h, p, factor)
+    h_cubed: Bytes = _mod_multiply(h_squared, h, p, factor)
+    v: Bytes = _mod_multiply(u_1, h_squared, p, factor)
+    x: Bytes = _field_subtract(
+        _field_subtract(_mod_multiply(r, r, p, factor), h_cubed, p),
+        _field_double(v, p),
+        p,
+    )
+    # y' = r * (u_1 * h ** 2 - x') - s_1 * h ** 3
+    y: Bytes = _field_subtract(
+        _mod_multiply(r, _field_subtract(v, x, p), p, factor),
+        _mod_multiply(s_1, h_cubed, p, factor),
+        p,
+    )
+    # z' = z_1 * z_2 * h
+    z: Bytes = _mod_multiply(z_1_z_2, h, p, factor)
+    return JacobianPoint(x, y, z)
+
+
+# _add_scaled over fields of up to 256 bits, reducing each coordinate once as for doubling
+@subroutine
+def _native_add_scaled(
+    a: JacobianPoint,
+    u_1: BigUInt,
+    s_1: BigUInt,
+    u_2: BigUInt,
+    s_2: BigUInt,
+    z_1_z_2: BigUInt,
+    curve: Curve,
+) -> JacobianPoint:
+    p: BigUInt = BigUInt.from_bytes(curve.p)
+    h: BigUInt = (u_2 + p - u_1) % p
+    r: BigUInt = (s_2 + p - s_1) % p
+    if h == 0:
+        if r == 0:
+            return point_double(a, curve)
+        return point_at_infinity(curve)
+
+    h_squared: BigUInt = h * h % p
+    h_cubed: BigUInt = h_squared * h % p
+    v: BigUInt = u_1 * h_squared % p
+    x: BigUInt = (r * r + p - h_cubed + (p - v) * 2) % p
+    y: BigUInt = (r * ((v + p - x) % p) + p - s_1 * h_cubed % p) % p
+    return _native_point(x, y, z_1_z_2 * h % p, curve.p.length)
+
+
+# Addition in Jacobian coordinates by Cohen, Miyaji and Ono
+@subroutine
+def point_add(a: JacobianPoint, b: JacobianPoint, curve: Curve) -> JacobianPoint:
+    if is_point_at_infinity(a):
+        return b
+    if is_point_at_infinity(b):
+        return a
+    BIGINT_BYTE_SIZE: UInt64 = UInt64(BIGINT_BYTE_SIZE_INT)
+    p: Bytes = curve.p
+    if p.length * 2 <= BIGINT_BYTE_SIZE:
+        p_int: BigUInt = BigUInt.from_bytes(p)
+        a_z: BigUInt = BigUInt.from_bytes(a.z)
+        b_z: BigUInt = BigUInt.from_bytes(b.z)
+        a_z_squared_int: BigUInt = a_z * a_z % p_int
+        b_z_squared_int: BigUInt = b_z * b_z % p_int
+        return _native_add_scaled(
+            a,
+            BigUInt.from_bytes(a.x) * b_z_squared_int % p_int,
+            BigUInt.from_bytes(a.y) * (b_z_squared_int * b_z % p_int) % p_int,
+            BigUInt.from_bytes(b.x) * a_z_squared_int % p_int,
+            BigUInt.from_bytes(b.y) * (a_z_squared_int * a_z % p_int) % p_int,
+            a_z * b_z % p_int,
+            curve,
+        )
+
+    factor: Bytes = curve.p_factor
+    a_z_squared: Bytes = _mod_multiply(a.z, a.z, p, factor)
+    b_z_squared: Bytes = _mod_multiply(b.z, b.z, p, factor)
+    a_z_cubed: Bytes = _mod_multiply(a_z_squared, a.z, p, factor)
+    b_z_cubed: Bytes = _mod_multiply(b_z_squared, b.z, p, factor)
+    return _add_scaled(
+        a,
+        _mod_multiply(a.x, b_z_squared, p, factor),
+        _mod_multiply(a.y, b_z_cubed, p, factor),
+        _mod_multiply(b.x, a_z_squared, p, factor),
+        _mod_multiply(b.y, a_z_cubed, p, factor),
+        _mod_multiply(a.z, b.z, p, factor),
+        curve,
+    )
+
+
+# Mixed addition of an affine point (x, y), which saves the scaling of a by z_b
+@subroutine
+def point_add_affine(
+    a: JacobianPoint, x: Bytes, y: Bytes, curve: Curve
+) -> JacobianPoint:
+    # Assume x, y < p and padded to the length of p
+    if is_point_at_infinity(a):
+        return JacobianPoint(x, y, _fit(itob(1), curve.p.length))
+    BIGINT_BYTE_SIZE: UInt64 = UInt64(BIGINT_BYTE_SIZE_INT)
+    p: Bytes = curve.p
+    if p.length * 2 <= BIGINT_BYTE_SIZE:
+        p_int: BigUInt = BigUInt.from_bytes(p)
+        z: BigUInt = BigUInt.from_bytes(a.z)
+        z_squared_int: BigUInt = z * z % p_int
+        return _native_add_scaled(
+            a,
+            BigUInt.from_bytes(a.x),
+            BigUInt.from_bytes(a.y),
+            BigUInt.from_bytes(x) * z_squared_int % p_int,
+            BigUInt.from_bytes(y) * (z_squared_int * z % p_int) % p_int,
+            z,
+            curve,
+        )
+
+    factor: Bytes = curve.p_factor
+    z_squared: Bytes = _mod_multiply(a.z, a.z, p, factor)
+    z_cubed: Bytes = _mod_multiply(z_squared, a.z, p, factor)
+    return _add_scaled(
+        a,
+        a.x,
+        a.y,
+        _mod_multiply(x, z_squared, p, factor),
+        _mod_multiply(y, z_cubed, p, factor),
+        a.z,
+        curve,
+    )
+
+
+@subroutine
+def _window(scalar: Bytes, i: UInt64) -> UInt64:
+    # The ith window of scalar, most significant first
+    WINDOW_BITS: UInt64 = UInt64(WINDOW_BITS_INT)
+    WINDOW_MASK: UInt64 = UInt64(WINDOW_MASK_INT)
+    byte: UInt64 = getbyte(scalar, i // 2)
+    if i % 2 == 0:
+        return byte >> WINDOW_BITS
+    return byte & WINDOW_MASK
+
+
+@subroutine
+def _window_table(point: JacobianPoint, curve: Curve) -> Bytes:
+    # Jacobian multiples 1P to 15P, concatenated. Even multiples are doublings, which are
+    # cheaper than additions.
+    WINDOW_MASK: UInt64 = UInt64(WINDOW_MASK_INT)
+    table: Bytes = concat(concat(point.x, point.y), point.z)
+    multiple: JacobianPoint = point
+    for i in urange(2, WINDOW_MASK + 1):
+        if i % 2 == 0:
+            multiple = point_double(_table_point(table, i // 2, curve), curve)
+        else:
+            multiple = point_add(multiple, point, curve)
+        table = concat(table, concat(concat(multiple.x, multiple.y), multiple.z))
+    return table
+
+
+@subroutine
+def _table_point(table: Bytes, digit: UInt64, curve: Curve) -> JacobianPoint:
+    length: UInt64 = curve.p.length
+    offset: UInt64 = (digit - 1) * length * 3
+    return JacobianPoint(
+        extract(table, offset, length),
+        extract(table, offset + length, length),
+        extract(table, offset + length * 2, length),
+    )
+
+
+# Windowed multiplication by Straus' method, sharing the doublings of both scalars
+@subroutine
+def _windowed_sum(
+    fixed_scalar: Bytes,
+    fixed_table: Bytes,
+    scalar: Bytes,
+    table: Bytes,
+    curve: Curve,
+) -> JacobianPoint:
+    # fixed_scalar * F + scalar * P, where fixed_table holds the affine multiples 1F to 15F
+    # and table the Jacobian multiples 1P to 15P
+    WINDOW_BITS: UInt64 = UInt64(WINDOW_BITS_INT)
+    length: UInt64 = curve.p.length
+    scalar_length: UInt64 = max_value(fixed_scalar.length, scalar.length)
+    fixed_scalar = pad(fixed_scalar, scalar_length)
+    scalar = pad(scalar, scalar_length)
+
+    result: JacobianPoint = point_at_infinity(curve)
+    for i in urange(scalar_length * 2):
+        for _j in urange(WINDOW_BITS):
+            result = point_double(result, curve)
+        fixed_digit: UInt64 = _window(fixed_scalar, i)
+        if fixed_digit != 0:
+            offset: UInt64 = (fixed_digit - 1) * length * 2
+            result = point_add_affine(
+                result,
+                extract(fixed_table, offset, length),
+                extract(fixed_table, offset + length, length),
+                curve,
+            )
+        digit: UInt64 = _window(scalar, i)
+        if digit != 0:
+            result = point_add(result, _table_point(table, digit, curve), curve)
+    return result
+
+
+@subroutine
+def scalar_multiply(k: Bytes, point: JacobianPoint, curve: Curve) -> JacobianPoint:
+    return _windowed_sum(Bytes(b""), Bytes(b""), k, _window_table(point, curve), curve)
+
+
+@subroutine
+def fixed_base_multiply(k: Bytes, table: Bytes, curve: Curve) -> JacobianPoint:
+    # table holds the affine multiples 1G to 15G of the base, e.g. secp256k1_generator_table
+    return _windowed_sum(k, table, Bytes(b""), Bytes(b""), curve)
+
+
+@subroutine
+def ecdsa_verify(
+    message_hash: Bytes,
+    r: Bytes,
+    s: Bytes,
+    public_key_x: Bytes,
+    public_key_y: Bytes,
+    curve: Curve,
+    generator_table: Bytes,
+) -> bool:
+    assert is_on_curve(
+        public_key_x, public_key_y, curve
+    ), "Public key must be on the curve"
+    zero: Bytes = itob(0)
+    if equal(r, zero) or not less_than(r, curve.n):
+        return False
+    if equal(s, zero) or not less_than(s, curve.n):
+        return False
+
+    r = _fit(r, curve.n.length)
+    s = _fit(s, curve.n.length)
+
+    # e is the leftmost bits of the hash, as many as n has, so e < 2 * n. Past the leading
+    # bytes holding them, the low bits are shifted out by multiplying by 2 ** (8 - shift) and
+    # dropping the last byte, which spares a divide.
+    n_bits: UInt64 = bitlen(curve.n)
+    e: Bytes = message_hash
+    if message_hash.length * 8 > n_bits:
+        e_length: UInt64 = (n_bits + 7) // 8
+        shift: UInt64 = e_length * 8 - n_bits
+        e = extract(message_hash, 0, e_length)
+        if shift != 0:
+            shifted: Bytes = _fit(multiply(e, power_of_two(8 - shift)), e_length + 1)
+            e = extract(shifted, 0, e_length)
+    if not less_than(e, curve.n):
+        e = subtract(e, curve.n)
+    e = _fit(e, curve.n.length)
+
+    # u_1 = e / s and u_2 = r / s mod n, inverting s by Fermat's little theorem
+    exp: Bytes = _fit(subtract(curve.n, itob(2)), curve.n.length)
+    s_inverse: Bytes = _mod_power(s, exp, curve.n, curve.n_factor)
+    u_1: Bytes = _mod_multiply(e, s_inverse, curve.n, curve.n_factor)
+    u_2: Bytes = _mod_multiply(r, s_inverse, curve.n, curve.n_factor)
+    public_key: JacobianPoint = to_jacobian(public_key_x, public_key_y, curve)
+    point: JacobianPoint = _windowed_sum(
+        u_1, generator_table, u_2, _window_table(public_key, curve), curve
+    )
+    if is_point_at_infinity(point):
+        return False
+
+    # Accept if x / z ** 2 = r mod n. Instead of inverting z, check x = c * z ** 2 for the
+    # candidates c = r, r + n, ... below p.
+    z_squared: Bytes = _mod_multiply(point.z, point.z, curve.p, curve.p_factor)
+    candidate: Bytes = r
+    while less_than(candidate, curve.p):
+        if (
+            _mod_multiply(
+                _fit(candidate, curve.p.length), z_squared, curve.p, curve.p_factor
+            )
+            == point.x
+        ):
+            return True
+        candidate = add(candidate, curve.n)
+    return False
+
+
+@subroutine
+def secp256k1() -> Curve:
+    return Curve(
+        p=Bytes.from_hex(
+            "FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F"
+        ),
+        p_factor=Bytes.from_hex(
+            "0100000000000000000000000000000000000000000000000000000001000003D1"
+        ),
+        a=Bytes.from_hex(
+            "0000000000000000000000000000000000000000000000000000000000000000"
+        ),
+        b=Bytes.from_hex(
+            "0000000000000000000000000000000000000000000000000000000000000007"
+        ),
+        n=Bytes.from_hex(
+            "FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141"
+        ),
+        n_factor=Bytes.from_hex(
+            "01000000000000000000000000000000014551231950B75FC4402DA1732FC9BEC0"
+        ),
+    )
+
+
+@subroutine
+def secp256k1_generator_table() -> Bytes:
+    # Affine multiples 1G to 15G of the secp256k1 generator, for fixed_base_multiply
+    return Bytes.from_hex(
+        "79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798"
+        "483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8"
+        "C6047F9441ED7D6D3045406E95C07CD85C778E4B8CEF3CA7ABAC09B95C709EE5"
+        "1AE168FEA63DC339A3C58419466CEAEEF7F632653266D0E1236431A950CFE52A"
+        "F9308A019258C31049344F85F89D5229B531C845836F99B08601F113BCE036F9"
+        "388F7B0F632DE8140FE337E62A37F3566500A99934C2231B6CB9FD7584B8E672"
+        "E493DBF1C10D80F3581E4904930B1404CC6C13900EE0758474FA94ABE8C4CD13"
+        "51ED993EA0D455B75642E2098EA51448D967AE33BFBDFE40CFE97BDC47739922"
+        "2F8BDE4D1A07209355B4A7250A5C5128E88B84BDDC619AB7CBA8D569B240EFE4"
+        "D8AC222636E5E3D6D4DBA9DDA6C9C426F788271BAB0D6840DCA87D3AA6AC62D6"
+        "FFF97BD5755EEEA420453A14355235D382F6472F8568A18B2F057A1460297556"
+        "AE12777AACFBB620F3BE96017F45C560DE80F0F6518FE4A03C870C36B075F297"
+        "5CBDF0646E5DB4EAA398F365F2EA7A0E3D419B7E0330E39CE92BDDEDCAC4F9BC"
+        "6AEBCA40BA255960A3178D6D861A54DBA813D0B813FDE7B5A5082628087264DA"
+        "2F01E5E15CCA351DAFF3843FB70F3C2F0A1BDD05E5AF888A67784EF3E10A2A01"
+        "5C4DA8A741539949293D082A132D13B4C2E213D6BA5B7617B5DA2CB76CBDE904"
+        "ACD484E2F0C7F65309AD178A9F559ABDE09796974C57E714C35F110DFC27CCBE"
+        "CC338921B0A7D9FD64380971763B61E9ADD888A4375F8E0F05CC262AC64F9C37"
+        "A0434D9E47F3C86235477C7B1AE6AE5D3442D49B1943C2B752A68E2A47E247C7"
+        "893ABA425419BC27A3B6C7E693A24C696F794C2ED877A1593CBEE53B037368D7"
+        "774AE7F858A9411E5EF4246B70C65AAC5649980BE5C17891BBEC17895DA008CB"
+        "D984A032EB6B5E190243DD56D7B7B365372DB1E2DFF9D6A8301D74C9C953C61B"
+        "D01115D548E7561B15C38F004D734633687CF4419620095BC5B0F47070AFE85A"
+        "A9F34FFDC815E0D7A8B64537E17BD81579238C5DD9A86D526B051B13F4062327"
+        "F28773C2D975288BC7D1D205C3748651B075FBC6610E58CDDEEDDF8F19405AA8"
+        "0AB0902E8D880A89758212EB65CDAF473A1A06DA521FA91F29B5CB52DB03ED81"
+        "499FDF9E895E719CFD64E67F07D38E3226AA7B63678949E6E49B241A60E823E4"
+        "CAC2F6C4B54E855190F044E4A7B3D464464279C27A3F95BCC65F40D403A13F5B"
+        "D7924D4F7D43EA965A465AE3095FF41131E5946F3C85F79E44ADBCF8E27E080E"
+        "581E2872A86C72A683842EC228CC6DEFEA40AF2BD896D3A5C504DC9FF6A26B58"
+    )
+
+
+@subroutine
+def p256() -> Curve:
+    return Curve(
+        p=Bytes.from_hex(
+            "FFFFFFFF00000001000000000000000000000000FFFFFFFFFFFFFFFFFFFFFFFF"
+        ),
+        p_factor=Bytes.from_hex(
+            "0100000000FFFFFFFFFFFFFFFEFFFFFFFEFFFFFFFEFFFFFFFF0000000000000003"
+        ),
+        a=Bytes.from_hex(
+            "FFFFFFFF00000001000000000000000000000000FFFFFFFFFFFFFFFFFFFFFFFC"
+        ),
+        b=Bytes.from_hex(
+            "5AC635D8AA3A93E7B3EBBD55769886BC651D06B0CC53B0F63BCE3C3E27D2604B"
+        ),
+        n=Bytes.from_hex(
+            "FFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551"
+        ),
+        n_factor=Bytes.from_hex(
+            "0100000000FFFFFFFFFFFFFFFEFFFFFFFF43190552DF1A6C21012FFD85EEDF9BFE"
+        ),
+    )
+
+
+@subroutine
+def p256_generator_table() -> Bytes:
+    # Affine multiples 1G to 15G of the P-256 generator, for fixed_base_multiply
+    return Bytes.from_hex(
+        "6B17D1F2E12C4247F8BCE6E563A440F277037D812DEB33A0F4A13945D898C296"
+        "4FE342E2FE1A7F9B8EE7EB4A7C0F9E162BCE33576B315ECECBB6406837BF51F5"
+        "7CF27B188D034F7E8A52380304B51AC3C08969E277F21B35A60B48FC47669978"
+        "07775510DB8ED040293D9AC69F7430DBBA7DADE63CE982299E04B79D227873D1"
+        "5ECBE4D1A6330A44C8F7EF951D4BF165E6C6B721EFADA985FB41661BC6E7FD6C"
+        "8734640C4998FF7E374B06CE1A64A2ECD82AB036384FB83D9A79B127A27D5032"
+        "E2534A3532D08FBBA02DDE659EE62BD0031FE2DB785596EF509302446B030852"
+        "E0F1575A4C633CC719DFEE5FDA862D764EFC96C3F30EE0055C42C23F184ED8C6"
+        "51590B7A515140D2D784C85608668FDFEF8C82FD1F5BE52421554A0DC3D033ED"
+        "E0C17DA8904A727D8AE1BF36BF8A79260D012F00D4D80888D1D0BB44FDA16DA4"
+        "B01A172A76A4602C92D3242CB897DDE3024C740DEBB215B4C6B0AAE93C2291A9"
+        "E85C10743237DAD56FEC0E2DFBA703791C00F7701C7E16BDFD7C48538FC77FE2"
+        "8E533B6FA0BF7B4625BB30667C01FB607EF9F8B8A80FEF5B300628703187B2A3"
+        "73EB1DBDE03318366D069F83A6F5900053C73633CB041B21C55E1A86C1F400B4"
+        "62D9779DBEE9B0534042742D3AB54CADC1D238980FCE97DBB4DD9DC1DB6FB393"
+        "AD5ACCBD91E9D8244FF15D771167CEE0A2ED51F6BBE76A78DA540A6A0F09957E"
+        "EA68D7B6FEDF0B71878938D51D71F8729E0ACB8C2C6DF8B3D79E8A4B90949EE0"
+        "2A2744C972C9FCE787014A964A8EA0C84D714FEAA4DE823FE85A224A4DD048FA"
+        "CEF66D6B2A3A993E591214D1EA223FB545CA6C471C48306E4C36069404C5723F"
+        "878662A229AAAE906E123CDD9D3B4C10590DED29FE751EEECA34BBAA44AF0773"
+        "3ED113B7883B4C590638379DB0C21CDA16742ED0255048BF433391D374BC21D1"
+        "9099209ACCC4C8A224C843AFA4F4C68A090D04DA5E9889DAE2F8EEFCE82A3740"
+        "741DD5BDA817D95E4626537320E5D55179983028B2F82C99D500C5EE8624E3C4"
+        "0770B46A9C385FDC567383554887B1548EEB912C35BA5CA71995FF22CD4481D3"
+        "177C837AE0AC495A61805DF2D85EE2FC792E284B65EAD58A98E15D9D46072C01"
+        "63BB58CD4EBEA558A24091ADB40F4E7226EE14C3A1FB4DF39C43BBE2EFC7BFD8"
+        "54E77A001C3862B97A76647F4336DF3CF126ACBE7A069C5E5709277324D2920B"
+        "F599F1BB29F4317542121F8C05A2E7C37171EA77735090081BA7C82F60D0B375"
+        "F0454DC6971ABAE7ADFB378999888265AE03AF92DE3A0EF163668C63E59B9D5F"
+        "B5B93EE3592E2D1F4E6594E51F9643E62A3B21CE75B5FA3F47E59CDE0D034F36"
+    )
+
+
+@subroutine
+def bn254() -> Curve:
+    return Curve(
+        p=Bytes.from_hex(
+            "30644E72E131A029B85045B68181585D97816A916871CA8D3C208C16D87CFD47"
+        ),
+        p_factor=Bytes.from_hex(
+            "054A47462623A04A7AB074A5868073013AE965E1767CD4C086F3AED8A19BF90E51"
+        ),
+        a=Bytes.from_hex(
+            "0000000000000000000000000000000000000000000000000000000000000000"
+        ),
+        b=Bytes.from_hex(
+            "0000000000000000000000000000000000000000000000000000000000000003"
+        ),
+        n=Bytes.from_hex(
+            "30644E72E131A029B85045B68181585D2833E84879B9709143E1F593F0000001"
+        ),
+        n_factor=Bytes.from_hex(
+            "054A47462623A04A7AB074A58680730147144852009E880AE620703A6BE1DE9259"
+        ),
+    )
+
+
+@subroutine
+def bn254_generator_table() -> Bytes:
+    # Affine multiples 1G to 15G of the BN254 generator, for fixed_base_multiply
+    return Bytes.from_hex(
+        "0000000000000000000000000000000000000000000000000000000000000001"
+        "0000000000000000000000000000000000000000000000000000000000000002"
+        "030644E72E131A029B85045B68181585D97816A916871CA8D3C208C16D87CFD3"
+        "15ED738C0E0A7C92E7845F96B2AE9C0A68A6A449E3538FC7FF3EBF7A5A18A2C4"
+        "0769BF9AC56BEA3FF40232BCB1B6BD159315D84715B8E679F2D355961915ABF0"
+        "2AB799BEE0489429554FDB7C8D086475319E63B40B9C5B57CDF1FF3DD9FE2261"
+        "06A7B64AF8F414BCBEEF455B1DA5208C9B592B83EE6599824CAA6D2EE9141A76"
+        "08E74E438CEE31AC104CE59B94E45FE98A97D8F8A6E75664CE88EF5A41E72FBC"
+        "17C139DF0EFEE0F766BC0204762B774362E4DED88953A39CE849A8A7FA163FA9"
+        "01E0559BACB160664764A357AF8A9FE70BAA9258E0B959273FFC5718C6D4CC7C"
+        "09F4CA411A3F52F4E0792FD9E792779856719215D3B32A762AFE3D5B8C684AF9"
+        "0D8EF3D795ACD4B35D4366AB22E4AD335273AA59429E26929D0F64583474D9C8"
+        "17072B2ED3BB8D759A5325F477629386CB6FC6ECB801BD76983A6B86ABFFE078"
+        "168ADA6CD130DD52017BB54BFA19377AADFE3BF05D18F41B77809F7F60D4AF9E"
+        "08B1D51D23480C10F472F5E93B9CFEA88238C121FE155AF7043937882C306A63"
+        "299836713DAD3FA34E337AA412466015C366AF8EC50B9D7BD05AA74642822021"
+        "039730EA8DFF1254C0FEE9C0EA777D29A9C710B7E616683F194F18C43B43B869"
+        "073A5FFCC6FC7A28C30723D6E58CE577356982D65B833A5A5C15BF9024B43D98"
+        "09D3A257B99F1AD804A9E2354EA71C72DA7FA518F4CA7904C6951D924B4045B4"
+        "174BE12AE3FD899D55D3E487FA103F951A24CA0F670ECAE802209B2518CCCA6C"
+        "2A14705537B009189DA8808651EECDB82482477FE92AC12CA8B71F80FC3D49EF"
+        "2DF7EE7F243EA8B38E1DDF14029258877A618C779FD4717DB6177E19EA67EC38"
+        "25D32C471C8CD1AB9AC9B4118D040166F75AD9E4F36526B09FC0B7D1002BC851"
+        "2DB09AE9BC0CB9ADDF3404069078F0367FF42B63CB1C200BAE5BF9095585B69C"
+        "05E86F8CC8A7A4F10F56093465679F17F8B8C3FDB41469E408B529E030F52F3F"
+        "2857BD14BBC09767BED8E913D3CCB42B2BC8738F715417DD6F020725D22BCD90"
+        "15BF2BB17880144B5D1CD2B1F46EFF9D617BFFD1CA57C37FB5A49BD84E53CF66"
+        "049C797F9CE0D17083DEB32B5E36F2EA2A212EE036598DD7624C168993D1355F"
+        "2D96B121486AB9DA7BF549E57D2F8A6CC1983A336903524FB05DCD507457F63C"
+        "1DCB45731979CA35DFDE49A476E273A1B1C9B52E3ECA22FAE279459920DAA7E3"
+    )
@@ -0,0 +1,321 @@
+# Off-chain op-count profiler for the algopy testing framework. Not compiled by Puya.
+import functools
+import importlib
+import inspect
+import typing
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+import algopy
+from algopy import arc4, op
+
+__all__ = ["Profile", "profile", "DEFAULT_MODULES"]
+
+# Modules whose subroutines are wrapped, and whose imported algopy.op functions are counted
+DEFAULT_MODULES: tuple[str, ...] = (
+    "puya_bignumber",
+    "puya_bignumber.bignumber",
+    "puya_bignumber.common",
+    "puya_bignumber.bignum",
+    "puya_bignumber.curve",
+)
+
+ROOT: str = "workload"
+
+# Emulated AVM ops by type, keyed by class then attribute
+_CLASS_OPS: dict[type, dict[str, str]] = {
+    algopy.Bytes: {
+        "__add__": "concat",
+        "__radd__": "concat",
+        "__getitem__": "extract",
+        "__eq__": "==",
+        "__ne__": "!=",
+        "__and__": "b&",
+        "__rand__": "b&",
+        "__or__": "b|",
+        "__ror__": "b|",
+        "__xor__": "b^",
+        "__rxor__": "b^",
+        "__invert__": "b~",
+        "length": "len",
+    },
+    algopy.BigUInt: {
+        "__add__": "b+",
+        "__radd__": "b+",
+        "__sub__": "b-",
+        "__rsub__": "b-",
+        "__mul__": "b*",
+        "__rmul__": "b*",
+        "__floordiv__": "b/",
+        "__rfloordiv__": "b/",
+        "__mod__": "b%",
+        "__rmod__": "b%",
+        "__and__": "b&",
+        "__or__": "b|",
+        "__xor__": "b^",
+        "__eq__": "b==",
+        "__lt__": "b<",
+        "__le__": "b<=",
+        "__gt__": "b>",
+        "__ge__": "b>=",
+    },
+    algopy.UInt64: {
+        "__add__": "+",
+        "__radd__": "+",
+        "__sub__": "-",
+        "__rsub__": "-",
+        "__mul__": "*",
+        "__rmul__": "*",
+        "__floordiv__": "/",
+        "__rfloordiv__": "/",
+        "__mod__": "%",
+        "__rmod__": "%",
+        "__and__": "&",
+        "__or__": "|",
+        "__xor__": "^",
+        "__lshift__": "shl",
+        "__rshift__": "shr",
+        "__eq__": "==",
+        "__lt__": "<",
+        "__le__": "<=",
+        "__gt__": ">",
+        "__ge__": ">=",
+    },
+    arc4.DynamicArray: {
+        "__getitem__": "extract",
+        "__setitem__": "replace",
+        "append": "concat",
+        "length": "len",
+    },
+}
+
+# Ops whose byte volume is tracked. Moved bytes are measured on the result, unless the
+# attribute returns nothing, in which case they are measured on the given argument.
+_MOVED_BYTES: frozenset[str] = frozenset(
+    ("concat", "extract", "extract3", "substring", "substring3", "replace")
+)
+_MOVED_ARGUMENT: dict[str, int] = {"__setitem__": 2, "append": 1}
+
+
+def _byte_length(value: object) -> int:
+    if isinstance(value, bytes):
+        return len(value)
+    if isinstance(value, algopy.Bytes):
+        return len(value.value)
+    encoded = getattr(value, "bytes", None)
+    if isinstance(encoded, algopy.Bytes):
+        return len(encoded.value)
+    return 0
+
+
+Path: typing.TypeAlias = tuple[str, ...]
+
+
+@dataclass
+class Profile:
+    """
+    Calls, emulated AVM ops by type, and bytes moved, keyed by subroutine call path.
+
+    Args:
+    - calls: Number of calls for each call path.
+    - ops: Op counts by type, attributed to the innermost subroutine of each call path.
+    - bytes_moved: Bytes moved by concat/extract/substring/replace for each call path.
+    """
+
+    calls: Counter[Path] = field(default_factory=Counter)
+    ops: defaultdict[Path, Counter[str]] = field(
+        default_factory=lambda: defaultdict(Counter)
+    )
+    bytes_moved: defaultdict[Path, Counter[str]] = field(
+        default_factory=lambda: defaultdict(Counter)
+    )
+    _stack: list[str] = field(default_factory=list, repr=False)
+    _in_op: bool = field(default=False, repr=False)
+
+    def enter(self, name: str) -> None:
+        self._stack.append(name)
+        self.calls[tuple(self._stack)] += 1
+
+    def exit(self) -> None:
+        self._stack.pop()
+
+    def record(self, op_name: str, moved: int) -> None:
+        path: Path = tuple(self._stack)
+        self.ops[path][op_name] += 1
+        if moved:
+            self.bytes_moved[path][op_name] += moved
+
+    def op_totals(self) -> Counter[str]:
+        """
+        Op counts by type over the whole workload.
+        """
+        totals: Counter[str] = Counter()
+        for counts in self.ops.values():
+            totals.update(counts)
+        return totals
+
+    def rows(self) -> list[dict[str, typing.Any]]:
+        """
+        Per subroutine statistics. Totals are inclusive of callees, counting recursive frames once.
+        """
+        stats: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        for path, count in self.calls.items():
+            stats[path[-1]]["calls"] += count
+        for path in set(self.ops) | set(self.bytes_moved):
+            op_count: int = sum(self.ops[path].values())
+            moved: int = sum(self.bytes_moved[path].values())
+            name: str = path[-1] if path else ROOT
+            stats[name]["self_ops"] += op_count
+            stats[name]["self_bytes"] += moved
+            for frame in set(path) | {ROOT}:
+                stats[frame]["total_ops"] += op_count
+                stats[frame]["total_bytes"] += moved
+        columns = ("calls", "self_ops", "total_ops", "self_bytes", "total_bytes")
+        return [
+            {"name": name, **{column: counts[column] for column in columns}}
+            for name, counts in stats.items()
+        ]
+
+    def table(self, sort_by: str = "total_ops") -> str:
+        """
+        The per subroutine statistics as a text table, sorted descending by `sort_by`.
+        """
+        rows = sorted(self.rows(), key=lambda row: row[sort_by], reverse=True)
+        headers = (
+            "name",
+            "calls",
+            "self_ops",
+            "total_ops",
+            "self_bytes",
+            "total_bytes",
+        )
+        cells = [headers] + [tuple(str(row[h]) for h in headers) for row in rows]
+        widths = [max(len(line[i]) for line in cells) for i in range(len(headers))]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if i == 0 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(line, widths))
+            )
+            for line in cells
+        )
+
+    def folded(self, weight: str = "ops") -> str:
+        """
+        Folded call stacks (`workload;multiply;add 42`), the input format of flamegraph.pl and speedscope.
+
+        Args:
+        - weight: One of "ops", "bytes" or "calls".
+        """
+        weights: dict[Path, int]
+        if weight == "ops":
+            weights = {path: sum(counts.values()) for path, counts in self.ops.items()}
+        elif weight == "bytes":
+            weights = {
+                path: sum(counts.values()) for path, counts in self.bytes_moved.items()
+            }
+        elif weight == "calls":
+            weights = dict(self.calls)
+        else:
+            raise ValueError(f"Unknown weight {weight}")
+        return "\n".join(
+            f"{';'.join((ROOT,) + path)} {value}"
+            for path, value in sorted(weights.items())
+            if value > 0
+        )
+
+
+def _wrap_subroutine(fn: typing.Callable, result: Profile) -> typing.Callable:
+    @functools.wraps(fn)
+    def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        result.enter(fn.__name__)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            result.exit()
+
+    return wrapper
+
+
+def _wrap_op(
+    op_name: str, fn: typing.Callable, result: Profile, moved_argument: int | None
+) -> typing.Callable:
+    measured: bool = op_name in _MOVED_BYTES
+
+    @functools.wraps(fn)
+    def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        # Ops implemented in terms of other ops count once
+        if result._in_op:
+            return fn(*args, **kwargs)
+        result._in_op = True
+        try:
+            value = fn(*args, **kwargs)
+            if value is NotImplemented:
+                return value
+            moved: int = 0
+            if measured:
+                moved = _byte_length(
+                    value if moved_argument is None else args[moved_argument]
+                )
+        finally:
+            result._in_op = False
+        result.record(op_name, moved)
+        return value
+
+    return wrapper
+
+
+@contextmanager
+def profile(
+    modules: typing.Iterable[str] = DEFAULT_MODULES,
+) -> typing.Iterator[Profile]:
+    """
+    Count subroutine calls, emulated AVM ops and bytes moved for the workload run inside the context.
+
+    Subroutines are wrapped in the namespaces of `modules`, so calls made through those modules (or
+    between subroutines) are attributed. Subroutines imported by name before entering the context are
+    not wrapped, and their ops are attributed to the workload root.
+
+    Args:
+    - modules: The modules whose subroutines are wrapped.
+    """
+    result: Profile = Profile()
+    loaded = [importlib.import_module(name) for name in modules]
+    module_names = {module.__name__ for module in loaded}
+    restore: list[tuple[object, str, object, bool]] = []
+
+    def patch(owner: object, name: str, replacement: object) -> None:
+        own: bool = name in vars(owner)
+        restore.append((owner, name, vars(owner).get(name), own))
+        setattr(owner, name, replacement)
+
+    wrapped: dict[typing.Callable, typing.Callable] = {}
+    for module in loaded:
+        for name, value in list(vars(module).items()):
+            if inspect.isfunction(value) and value.__module__ in module_names:
+                if value not in wrapped:
+                    wrapped[value] = _wrap_subroutine(value, result)
+                patch(module, name, wrapped[value])
+            elif callable(value) and getattr(op, name, None) is value:
+                patch(module, name, _wrap_op(name, value, result, None))
+
+    for cls, attributes in _CLASS_OPS.items():
+        for name, op_name in attributes.items():
+            attribute = inspect.getattr_static(cls, name, None)
+            if attribute is None:
+                continue
+            moved_argument: int | None = _MOVED_ARGUMENT.get(name)
+            if isinstance(attribute, property):
+                getter = _wrap_op(op_name, attribute.fget, result, moved_argument)
+                patch(cls, name, property(getter))
+            else:
+                patch(cls, name, _wrap_op(op_name, attribute, result, moved_argument))
+
+    try:
+        yield result
+    finally:
+        for owner, name, original, own in reversed(restore):
+            if own:
+                setattr(owner, name, original)
+            else:
+                delattr(owner, name)
@@ -0,0 +1,396 @@
+# Executes the approval TEAL compiled by puyapy for a single app call, with the AVM's opcode costs.
+# Covers the opcodes the tester contracts compile to, so budgets can be measured without a node:
+#
+#   program = Program.from_file("./tests/build/BignumberTester.approval.teal")
+#   result = program.call([selector, *encoded_args])
+import typing
+from collections import Counter
+from dataclasses import dataclass, field
+
+from puya_bignumber.cost import OPCODE_COSTS
+
+Value: typing.TypeAlias = int | bytes
+
+MAX_UINT64: int = 2**64 - 1
+MAX_STACK_SIZE: int = 1000
+MAX_BYTE_MATH_SIZE: int = 64
+MAX_STRING_SIZE: int = 4096
+MAX_LOG_CALLS: int = 32
+MAX_LOG_SIZE: int = 1024
+ON_COMPLETION_NOOP: int = 0
+
+
+class AVMError(Exception):
+    pass
+
+
+@dataclass
+class Frame:
+    return_pc: int
+    height: int
+    args: int = 0
+    returns: int = 0
+    proto: bool = False
+
+
+@dataclass
+class Result:
+    """
+    The outcome of an app call.
+
+    Args:
+    - approved: Whether the program returned a nonzero uint64.
+    - cost: The opcode budget consumed.
+    - logs: The logged byte strings, of which the last holds an ARC4 return value.
+    - ops: The number of times each opcode was executed, by the subroutine call depth it ran at.
+    """
+
+    approved: bool
+    cost: int
+    logs: list[bytes] = field(default_factory=list)
+    ops: Counter[tuple[int, str]] = field(default_factory=Counter)
+
+
+def _parse_immediate(token: str) -> Value:
+    if token.startswith("0x"):
+        return bytes.fromhex(token[2:])
+    if token.startswith('"'):
+        return token[1:-1].encode()
+    return int(token)
+
+
+def _strip_comment(line: str) -> str:
+    # Comments start at // outside of string literals
+    in_string: bool = False
+    for i, char in enumerate(line):
+        if char == '"':
+            in_string = not in_string
+        elif not in_string and line.startswith("//", i):
+            return line[:i]
+    return line
+
+
+def _big(value: bytes) -> int:
+    if len(value) > MAX_BYTE_MATH_SIZE:
+        raise AVMError(f"byte math input of {len(value)} bytes")
+    return int.from_bytes(value)
+
+
+def _uint_big(num: int) -> int:
+    if num < 0:
+        raise AVMError("byte math underflow")
+    return num
+
+
+def _minimal(num: int) -> bytes:
+    # Byte math results are big-endian without leading zeros, so zero is empty
+    return num.to_bytes((num.bit_length() + 7) // 8)
+
+
+def _check_string(value: bytes) -> bytes:
+    if len(value) > MAX_STRING_SIZE:
+        raise AVMError(f"byte string of {len(value)} bytes")
+    return value
+
+
+def _uint64(num: int) -> int:
+    if not 0 <= num <= MAX_UINT64:
+        raise AVMError(f"uint64 overflow {num}")
+    return num
+
+
+def _bitwise(a: bytes, b: bytes, fn: typing.Callable[[int, int], int]) -> bytes:
+    length: int = max(len(a), len(b))
+    return fn(int.from_bytes(a), int.from_bytes(b)).to_bytes(length)
+
+
+def _extract(value: bytes, start: int, length: int) -> bytes:
+    if length < 0 or start + length > len(value):
+        raise AVMError(f"extract {start}:{start + length} of {len(value)} bytes")
+    return value[start : start + length]
+
+
+def _replace(value: bytes, start: int, replacement: bytes) -> bytes:
+    if start + len(replacement) > len(value):
+        raise AVMError(f"replace {start}:{start + len(replacement)} of {len(value)}")
+    return value[:start] + replacement + value[start + len(replacement) :]
+
+
+def _getbit(value: Value, bit: int) -> int:
+    if isinstance(value, int):
+        return (value >> bit) & 1
+    # Bit 0 is the most significant bit of the first byte
+    return (value[bit // 8] >> (7 - bit % 8)) & 1
+
+
+def _setbit(value: Value, bit: int, set_to: int) -> Value:
+    if isinstance(value, int):
+        return value | (1 << bit) if set_to else value & ~(1 << bit)
+    mask: int = 1 << (7 - bit % 8)
+    array: bytearray = bytearray(value)
+    array[bit // 8] = array[bit // 8] | mask if set_to else array[bit // 8] & ~mask
+    return bytes(array)
+
+
+def _bitlen(value: Value) -> int:
+    return (
+        value.bit_length()
+        if isinstance(value, int)
+        else int.from_bytes(value).bit_length()
+    )
+
+
+def _btoi(value: bytes) -> int:
+    if len(value) > 8:
+        raise AVMError(f"btoi of {len(value)} bytes")
+    return int.from_bytes(value)
+
+
+def _bsqrt(value: bytes) -> bytes:
+    num: int = _big(value)
+    root: int = 0 if num == 0 else 1 << ((num.bit_length() + 1) // 2)
+    while root * root > num:
+        root = (root + num // root) // 2
+    return _minimal(root)
+
+
+# Pure ops by name, taking their stack arguments in order
+BINARY_OPS: dict[str, typing.Callable[[typing.Any, typing.Any], Value]] = {
+    "+": lambda a, b: _uint64(a + b),
+    "-": lambda a, b: _uint64(a - b),
+    "*": lambda a, b: _uint64(a * b),
+    "/": lambda a, b: a // b,
+    "%": lambda a, b: a % b,
+    "==": lambda a, b: int(a == b),
+    "!=": lambda a, b: int(a != b),
+    "<": lambda a, b: int(a < b),
+    ">": lambda a, b: int(a > b),
+    "<=": lambda a, b: int(a <= b),
+    ">=": lambda a, b: int(a >= b),
+    "&&": lambda a, b: int(bool(a) and bool(b)),
+    "||": lambda a, b: int(bool(a) or bool(b)),
+    "&": lambda a, b: a & b,
+    "|": lambda a, b: a | b,
+    "^": lambda a, b: a ^ b,
+    "shl": lambda a, b: (a << b) & MAX_UINT64,
+    "shr": lambda a, b: a >> b,
+    "concat": lambda a, b: _check_string(a + b),
+    "getbit": _getbit,
+    "getbyte": lambda a, b: a[b],
+    "b+": lambda a, b: _minimal(_big(a) + _big(b)),
+    "b-": lambda a, b: _minimal(_uint_big(_big(a) - _big(b))),
+    "b*": lambda a, b: _minimal(_big(a) * _big(b)),
+    "b/": lambda a, b: _minimal(_big(a) // _big(b)),
+    "b%": lambda a, b: _minimal(_big(a) % _big(b)),
+    "b==": lambda a, b: int(_big(a) == _big(b)),
+    "b!=": lambda a, b: int(_big(a) != _big(b)),
+    "b<": lambda a, b: int(_big(a) < _big(b)),
+    "b>": lambda a, b: int(_big(a) > _big(b)),
+    "b<=": lambda a, b: int(_big(a) <= _big(b)),
+    "b>=": lambda a, b: int(_big(a) >= _big(b)),
+    "b&": lambda a, b: _bitwise(a, b, lambda x, y: x & y),
+    "b|": lambda a, b: _bitwise(a, b, lambda x, y: x | y),
+    "b^": lambda a, b: _bitwise(a, b, lambda x, y: x ^ y),
+}
+UNARY_OPS: dict[str, typing.Callable[[typing.Any], Value]] = {
+    "!": lambda a: int(a == 0),
+    "~": lambda a: MAX_UINT64 ^ a,
+    "len": len,
+    "itob": lambda a: a.to_bytes(8),
+    "btoi": _btoi,
+    "bzero": lambda a: _check_string(bytes(a)),
+    "bitlen": _bitlen,
+    "b~": lambda a: bytes(255 - byte for byte in a),
+    "bsqrt": _bsqrt,
+}
+TERNARY_OPS: dict[str, typing.Callable[[typing.Any, typing.Any, typing.Any], Value]] = {
+    "extract3": _extract,
+    "substring3": lambda a, b, c: _extract(a, b, c - b),
+    "replace3": _replace,
+    "setbit": _setbit,
+    "select": lambda a, b, c: b if c != 0 else a,
+}
+
+
+class Program:
+    """
+    Approval TEAL compiled by puyapy, parsed once to run any number of app calls.
+
+    Args:
+    - source: The TEAL source.
+    """
+
+    def __init__(self, source: str):
+        self.ops: list[tuple[str, list[str]]] = []
+        self.labels: dict[str, int] = {}
+        for raw_line in source.splitlines():
+            line: str = _strip_comment(raw_line).strip()
+            if not line or line.startswith("#pragma"):
+                continue
+            if line.endswith(":"):
+                self.labels[line[:-1]] = len(self.ops)
+                continue
+            op, *immediates = line.split()
+            self.ops.append((op, immediates))
+
+    @classmethod
+    def from_file(cls, path: str) -> "Program":
+        with open(path) as f:
+            return cls(f.read())
+
+    def call(self, app_args: list[bytes], app_id: int = 1) -> Result:
+        """
+        Run the program for a NoOp call with the given application arguments.
+
+        Args:
+        - app_args: The application arguments, starting with the ARC4 method selector.
+        - app_id: The application ID, where 0 is a create call.
+        """
+        stack: list[Value] = []
+        frames: list[Frame] = []
+        int_constants: list[int] = []
+        byte_constants: list[bytes] = []
+        result: Result = Result(False, 0)
+        txn: dict[str, Value] = {
+            "NumAppArgs": len(app_args),
+            "OnCompletion": ON_COMPLETION_NOOP,
+            "ApplicationID": app_id,
+        }
+
+        def pop() -> Value:
+            if not stack:
+                raise AVMError("stack underflow")
+            return stack.pop()
+
+        def push(value: Value) -> None:
+            if len(stack) >= MAX_STACK_SIZE:
+                raise AVMError("stack overflow")
+            stack.append(value)
+
+        pc: int = 0
+        while pc < len(self.ops):
+            op, immediates = self.ops[pc]
+            pc += 1
+            result.ops[len(frames), op] += 1
+            result.cost += OPCODE_COSTS.get(op, 1)
+            if op in BINARY_OPS:
+                b, a = pop(), pop()
+                push(BINARY_OPS[op](a, b))
+            elif op in UNARY_OPS:
+                push(UNARY_OPS[op](pop()))
+            elif op in TERNARY_OPS:
+                c, b, a = pop(), pop(), pop()
+                push(TERNARY_OPS[op](a, b, c))
+            elif op == "intcblock":
+                int_constants = [int(token) for token in immediates]
+            elif op == "bytecblock":
+                byte_constants = [_parse_immediate(token) for token in immediates]
+            elif op.startswith("intc"):
+                push(int_constants[int(op[5:] if op[4:] else immediates[0])])
+            elif op.startswith("bytec"):
+                push(byte_constants[int(op[6:] if op[5:] else immediates[0])])
+            elif op in ("pushint", "pushbytes", "pushints", "pushbytess"):
+                for token in immediates:
+                    push(_parse_immediate(token))
+            elif op == "frame_dig":
+                push(stack[frames[-1].height + int(immediates[0])])
+            elif op == "frame_bury":
+                index: int = frames[-1].height + int(immediates[0])
+                stack[index] = pop()
+            elif op == "dup":
+                push(stack[-1])
+            elif op == "dup2":
+                push(stack[-2])
+                push(stack[-2])
+            elif op == "dupn":
+                for _ in range(int(immediates[0])):
+                    push(stack[-1])
+            elif op == "pop":
+                pop()
+            elif op == "popn":
+                for _ in range(int(immediates[0])):
+                    pop()
+            elif op == "swap":
+                stack[-1], stack[-2] = stack[-2], stack[-1]
+            elif op == "dig":
+                push(stack[-1 - int(immediates[0])])
+            elif op == "cover":
+                depth: int = int(immediates[0])
+                stack.insert(len(stack) - 1 - depth, pop())
+            elif op == "uncover":
+                push(stack.pop(len(stack) - 1 - int(immediates[0])))
+            elif op == "extract":
+                start, length = int(immediates[0]), int(immediates[1])
+                value: bytes = pop()
+                # A length of 0 extracts to the end
+                push(_extract(value, start, length or len(value) - start))
+            elif op == "substring":
+                start, end = int(immediates[0]), int(immediates[1])
+                push(_extract(pop(), start, end - start))
+            elif op == "replace2":
+                replacement: bytes = pop()
+                push(_replace(pop(), int(immediates[0]), replacement))
+            elif op == "extract_uint16":
+                start = pop()
+                push(int.from_bytes(_extract(pop(), start, 2)))
+            elif op == "extract_uint64":
+                start = pop()
+                push(int.from_bytes(_extract(pop(), start, 8)))
+            elif op == "txn":
+                push(txn[immediates[0]])
+            elif op == "txna":
+                push(app_args[int(immediates[1])])
+            elif op == "b":
+                pc = self.labels[immediates[0]]
+            elif op == "bz":
+                if pop() == 0:
+                    pc = self.labels[immediates[0]]
+            elif op == "bnz":
+                if pop() != 0:
+                    pc = self.labels[immediates[0]]
+            elif op == "match":
+                target: Value = pop()
+                cases: list[Value] = [pop() for _ in immediates][::-1]
+                if target in cases:
+                    pc = self.labels[immediates[cases.index(target)]]
+            elif op == "callsub":
+                frames.append(Frame(pc, len(stack)))
+                pc = self.labels[immediates[0]]
+            elif op == "proto":
+                frame: Frame = frames[-1]
+                frame.args, frame.returns = int(immediates[0]), int(immediates[1])
+                frame.proto = True
+                if len(stack) < frame.args:
+                    raise AVMError("proto arguments missing")
+            elif op == "retsub":
+                frame = frames.pop()
+                if frame.proto:
+                    # The first locals are returned in place of the arguments, and the
+                    # stack above them is popped
+                    if len(stack) < frame.height + frame.returns:
+                        raise AVMError("retsub below the frame")
+                    returned: list[Value] = stack[
+                        frame.height : frame.height + frame.returns
+                    ]
+                    del stack[frame.height - frame.args :]
+                    stack.extend(returned)
+                pc = frame.return_pc
+            elif op == "assert":
+                if pop() == 0:
+                    raise AVMError(f"assert failed at {self.ops[pc - 2]}")
+            elif op == "err":
+                raise AVMError("err")
+            elif op == "log":
+                result.logs.append(pop())
+                if (
+                    len(result.logs) > MAX_LOG_CALLS
+                    or sum(map(len, result.logs)) > MAX_LOG_SIZE
+                ):
+                    raise AVMError("log limit exceeded")
+            elif op == "return":
+                result.approved = pop() != 0
+                return result
+            else:
+                raise AVMError(f"unsupported op {op}")
+        result.approved = bool(stack) and stack[-1] != 0
+        return result
@@ -1,6 +1,10 @@
 import os
 import subprocess
 
+# Approval and clear programs together, at the limit of 3 extra pages
+MAX_PROGRAM_SIZE: int = 4 * 2048
+BUILD_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "build")
+
 
 def process_algokit(dir_path: str, filename: str) -> None:
     """
@@ -10,14 +14,11 @@ def process_algokit(dir_path: str, filename: str) -> None:
     - dir_path: The directory path where the contract file is located.
     - filename: The name of the file (without the extension).
     """
-    # Get the script directory (assuming the script is run from its location)
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-
     # Full path to the contract file
     contract_path = os.path.join(dir_path, f"{filename}.py")
 
     # Output directory for the compiled files
-    output_dir = os.path.join(script_dir, "build")
+    output_dir = BUILD_DIR
 
     # Ensure the output directory exists
     os.makedirs(output_dir, exist_ok=True)
@@ -32,6 +33,7 @@ def process_algokit(dir_path: str, filename: str) -> None:
         "0",
         "-O",
         "2",
+        "--output-bytecode",
         "--out-dir",
         output_dir,
     ]
@@ -40,3 +42,16 @@ def process_algokit(dir_path: str, filename: str) -> None:
 
 def build(path: str, filename: str):
     process_algokit(path, filename)
+
+
+def program_size(contract: str) -> int:
+    """
+    The bytecode size of a built contract, approval and clear programs together.
+
+    Args:
+    - contract: The name of the contract class.
+    """
+    return sum(
+        os.path.getsize(os.path.join(BUILD_DIR, f"{contract}.{program}.bin"))
+        for program in ("approval", "clear")
+    )
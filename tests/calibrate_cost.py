@@ -0,0 +1,305 @@
+# Calibrates STACK_OPS_PER_OP and CALL_OVERHEAD in puya_bignumber/cost.py against the compiled
+# BignumberTester. Requires a running localnet (algokit localnet start), or with --teal executes
+# the compiled TEAL with tests/avm.py instead. As the interpreter counts the opcodes executed,
+# --teal fits the actual stack ops rather than the gap to the worst case estimates.
+#
+#   poetry run python -m tests.calibrate_cost [--teal]
+import argparse
+import base64
+import math
+import os
+import random
+from collections import Counter
+from fractions import Fraction
+
+from algosdk import abi, transaction
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    EmptySigner,
+)
+from algosdk.kmd import KMDClient
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.models import SimulateRequest
+
+from puya_bignumber.cost import OPCODE_COSTS, trace_ops
+from .avm import Program, Result
+from .build import build
+
+ALGOD_ADDRESS: str = os.environ.get("ALGOD_SERVER", "http://localhost:4001")
+KMD_ADDRESS: str = os.environ.get("KMD_SERVER", "http://localhost:4002")
+TOKEN: str = "a" * 64
+# 16 app calls worth of pooled budget, the most simulate grants
+MAX_BUDGET: int = 320_000
+PAGE_SIZE: int = 2048
+BUILD_PATH: str = "./tests/build/BignumberTester"
+SEED: int = 0
+# Opcodes the estimates leave to STACK_OPS_PER_OP and CALL_OVERHEAD, by name prefix
+STACK_OPCODE_PREFIXES: tuple[str, ...] = (
+    "frame_",
+    "dup",
+    "dig",
+    "swap",
+    "cover",
+    "uncover",
+    "pop",
+    "intc",
+    "bytec",
+    "push",
+    "callsub",
+    "retsub",
+    "proto",
+    "assert",
+)
+BRANCH_OPCODES: tuple[str, ...] = ("b", "bz", "bnz")
+# Beneath the operator run the main program, the ARC4 router and the tester method
+OPERATOR_DEPTH: int = 3
+
+METHODS: dict[str, str] = {
+    "add": "add(byte[],byte[])byte[]",
+    "subtract": "subtract(byte[],byte[])byte[]",
+    "equal": "equal(byte[],byte[])bool",
+    "less_than": "less_than(byte[],byte[])bool",
+    "greater_than": "greater_than(byte[],byte[])bool",
+    "multiply": "multiply(byte[],byte[])byte[]",
+    "divide": "divide(byte[],byte[])byte[]",
+    "barrett_reducer_factor": "barrett_reducer_factor(byte[])byte[]",
+    "mod_barrett_reduce": "mod_barrett_reduce(byte[],byte[],byte[])byte[]",
+    "modexp_barrett_reduce": "modexp_barrett_reduce(byte[],byte[],byte[],byte[])byte[]",
+    "isqrt": "isqrt(byte[])byte[]",
+    "iroot": "iroot(byte[],uint64)byte[]",
+    "verify_isqrt": "verify_isqrt(byte[],byte[])bool",
+}
+
+
+def _to_bytes(num: int) -> bytes:
+    return num.to_bytes(max(1, (num.bit_length() + 7) // 8))
+
+
+def _operand(rng: random.Random, length: int) -> bytes:
+    # All-0xFF operands carry at every digit, so most often take the costliest paths
+    if rng.random() < 0.5:
+        return b"\xff" * length
+    return bytes([rng.randint(1, 255)]) + rng.randbytes(length - 1)
+
+
+def _modulus(rng: random.Random, length: int) -> bytes:
+    while True:
+        mod: bytes = _operand(rng, length)
+        mod_int: int = int.from_bytes(mod)
+        if mod_int & (mod_int - 1) != 0:
+            return mod
+
+
+def _factor(mod: bytes) -> bytes:
+    return _to_bytes(2 ** (16 * len(mod)) // int.from_bytes(mod))
+
+
+def cases(rng: random.Random) -> list[tuple[str, list, tuple[int, ...]]]:
+    """
+    Operator calls as (op, ABI arguments, estimate_cost lengths).
+    """
+    result: list[tuple[str, list, tuple[int, ...]]] = []
+    widths: tuple[int, ...] = (1, 8, 32, 33, 64, 65, 96, 128, 192, 256)
+    for a_length in widths:
+        for b_length in widths:
+            a, b = _operand(rng, a_length), _operand(rng, b_length)
+            for op in ("add", "equal", "less_than", "greater_than", "multiply"):
+                result.append((op, [a, b], (a_length, b_length)))
+            if a_length > b_length:
+                result.append(("subtract", [a, b], (a_length, b_length)))
+                result.append(("divide", [a, b], (a_length, b_length)))
+        a = _operand(rng, a_length)
+        root: bytes = _to_bytes(math.isqrt(int.from_bytes(a)))
+        result.append(("isqrt", [a], (a_length,)))
+        result.append(("verify_isqrt", [a, root], (a_length, len(root))))
+        for n in (3, 5):
+            result.append(("iroot", [_operand(rng, a_length), n], (a_length, n)))
+    for mod_length in (8, 32, 33, 48, 64):
+        mod: bytes = _modulus(rng, mod_length)
+        factor: bytes = _factor(mod)
+        a: bytes = _to_bytes(rng.randrange(int.from_bytes(mod) ** 2))
+        exp: bytes = b"\xff" * 4
+        result.append(("barrett_reducer_factor", [mod], (mod_length,)))
+        result.append(
+            ("mod_barrett_reduce", [a, mod, factor], (len(a), mod_length, len(factor)))
+        )
+        result.append(
+            (
+                "modexp_barrett_reduce",
+                [a, exp, mod, factor],
+                (len(a), len(exp), mod_length, len(factor)),
+            )
+        )
+    return result
+
+
+def _deploy(algod: AlgodClient, sender: str, private_key: str) -> int:
+    programs: list[bytes] = []
+    for kind in ("approval", "clear"):
+        with open(f"{BUILD_PATH}.{kind}.teal") as f:
+            programs.append(base64.b64decode(algod.compile(f.read())["result"]))
+    # Programs past the first page of 2048 bytes need extra pages, up to 3
+    extra_pages: int = (len(programs[0]) + len(programs[1]) - 1) // PAGE_SIZE
+    txn = transaction.ApplicationCreateTxn(
+        sender,
+        algod.suggested_params(),
+        transaction.OnComplete.NoOpOC,
+        programs[0],
+        programs[1],
+        transaction.StateSchema(0, 0),
+        transaction.StateSchema(0, 0),
+        extra_pages=extra_pages,
+    )
+    txid: str = algod.send_transaction(txn.sign(private_key))
+    return transaction.wait_for_confirmation(algod, txid)["application-index"]
+
+
+def _funded_account(kmd: KMDClient) -> tuple[str, str]:
+    wallet = next(
+        w for w in kmd.list_wallets() if w["name"] == "unencrypted-default-wallet"
+    )
+    handle: str = kmd.init_wallet_handle(wallet["id"], "")
+    address: str = kmd.list_keys(handle)[0]
+    return address, kmd.export_key(handle, "", address)
+
+
+def measure(
+    algod: AlgodClient, app_id: int, sender: str, op: str, args: list
+) -> int | None:
+    """
+    The app budget consumed by one call of `op`, or None if it exceeds MAX_BUDGET.
+    """
+    atc = AtomicTransactionComposer()
+    atc.add_method_call(
+        app_id,
+        abi.Method.from_signature(METHODS[op]),
+        sender,
+        algod.suggested_params(),
+        EmptySigner(),
+        method_args=args,
+    )
+    request = SimulateRequest(
+        txn_groups=[], allow_empty_signatures=True, extra_opcode_budget=MAX_BUDGET
+    )
+    response = atc.simulate(algod, request).simulate_response
+    group = response["txn-groups"][0]
+    if "failure-message" in group:
+        return None
+    return group["txn-results"][0]["app-budget-consumed"]
+
+
+def measure_teal(program: Program, op: str, args: list) -> Result | None:
+    """
+    One call of `op` executed by tests/avm.py, or None if it exceeds MAX_BUDGET.
+    """
+    method = abi.Method.from_signature(METHODS[op])
+    app_args: list[bytes] = [method.get_selector()] + [
+        arg.type.encode(value) for arg, value in zip(method.args, args)
+    ]
+    result = program.call(app_args)
+    assert result.approved, f"{op} rejected"
+    if result.cost > MAX_BUDGET:
+        return None
+    return result
+
+
+def _is_stack_opcode(name: str) -> bool:
+    return name in BRANCH_OPCODES or name.startswith(STACK_OPCODE_PREFIXES)
+
+
+def _solve(rows: list[list[Fraction]], targets: list[Fraction]) -> list[Fraction]:
+    # Least squares by the normal equations, with Gaussian elimination
+    size: int = len(rows[0])
+    matrix = [
+        [sum(row[i] * row[j] for row in rows) for j in range(size)]
+        + [sum(row[i] * t for row, t in zip(rows, targets))]
+        for i in range(size)
+    ]
+    for i in range(size):
+        pivot: int = next(r for r in range(i, size) if matrix[r][i] != 0)
+        matrix[i], matrix[pivot] = matrix[pivot], matrix[i]
+        for r in range(size):
+            if r != i:
+                ratio: Fraction = matrix[r][i] / matrix[i][i]
+                matrix[r] = [x - ratio * y for x, y in zip(matrix[r], matrix[i])]
+    return [matrix[i][size] / matrix[i][i] for i in range(size)]
+
+
+def calibrate(teal: bool = False) -> None:
+    build("./tests", "tester_contract")
+    if teal:
+        program: Program = Program.from_file(f"{BUILD_PATH}.approval.teal")
+    else:
+        algod = AlgodClient(TOKEN, ALGOD_ADDRESS)
+        sender, key = _funded_account(KMDClient(TOKEN, KMD_ADDRESS))
+        app_id: int = _deploy(algod, sender, key)
+
+    # Stack ops ~ stack_ops_per_op * ops + call_overhead * calls, plus the ABI routing on a
+    # localnet. The interpreter leaves the routing out, by the call depth of each op.
+    rows: list[list[Fraction]] = []
+    targets: list[Fraction] = []
+    samples: list[tuple[str, tuple[int, ...], int, int, int, int]] = []
+    for op, args, lengths in cases(random.Random(SEED)):
+        estimate = trace_ops(op, *lengths)
+        priced: int = sum(
+            count * OPCODE_COSTS.get(name, 1) for name, count in estimate.ops.items()
+        )
+        ops: int = sum(estimate.ops.values())
+        if teal:
+            result: Result | None = measure_teal(program, op, args)
+            if result is None:
+                continue
+            operator_ops: Counter[str] = Counter()
+            for (depth, name), count in result.ops.items():
+                if depth >= OPERATOR_DEPTH:
+                    operator_ops[name] += count
+            consumed: int = sum(
+                count * OPCODE_COSTS.get(name, 1)
+                for name, count in operator_ops.items()
+            )
+            stack_ops: int = sum(
+                count for name, count in operator_ops.items() if _is_stack_opcode(name)
+            )
+            # Each subroutine call of the operator returns once
+            calls: int = operator_ops["retsub"]
+            rows.append([Fraction(operator_ops.total() - stack_ops), Fraction(calls)])
+            targets.append(Fraction(stack_ops))
+        else:
+            consumed: int | None = measure(algod, app_id, sender, op, args)
+            if consumed is None:
+                continue
+            rows.append([Fraction(ops), Fraction(estimate.calls), Fraction(1)])
+            targets.append(Fraction(consumed - priced))
+        samples.append((op, lengths, consumed, priced, ops, estimate.calls))
+
+    stack, call, *intercept = _solve(rows, targets)
+    routing: int = math.ceil(intercept[0]) if intercept else 0
+    stack_ops_per_op: int = max(0, math.ceil(stack))
+    call_overhead: int = max(0, math.ceil(call))
+    # Round up until every sample is bounded, as the estimate must never under-budget
+    while any(
+        priced + stack_ops_per_op * ops + call_overhead * calls + routing < consumed
+        for _, _, consumed, priced, ops, calls in samples
+    ):
+        call_overhead += 1
+
+    print(f"{'op':<24}{'lengths':<22}{'consumed':>10}{'estimate':>10}{'ratio':>8}")
+    for op, lengths, consumed, priced, ops, calls in samples:
+        estimate: int = priced + stack_ops_per_op * ops + call_overhead * calls
+        ratio: float = (estimate + routing) / consumed
+        print(f"{op:<24}{str(lengths):<22}{consumed:>10}{estimate:>10}{ratio:>8.2f}")
+    print(f"Fit: {float(stack):.2f} stack ops per op, {float(call):.2f} per call")
+    if intercept:
+        print(f"ABI routing overhead: {float(intercept[0]):.1f}")
+    print(f"STACK_OPS_PER_OP = {stack_ops_per_op}")
+    print(f"CALL_OVERHEAD = {call_overhead}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--teal",
+        action="store_true",
+        help="Execute the compiled TEAL with tests/avm.py instead of a localnet",
+    )
+    calibrate(parser.parse_args().teal)
@@ -0,0 +1,48 @@
+from algopy import (
+    arc4,
+    Bytes,
+)
+from puya_bignumber import (
+    Curve,
+    to_jacobian,
+    to_affine,
+    scalar_multiply,
+    fixed_base_multiply,
+    ecdsa_verify,
+    secp256k1,
+    secp256k1_generator_table,
+    p256,
+    p256_generator_table,
+    bn254,
+    bn254_generator_table,
+)
+
+
+# Apart from BignumberTester, as the curve constants and generator tables would take it past the
+# program size limit
+class CurveTester(arc4.ARC4Contract):
+    @arc4.abimethod()
+    def secp256k1_ecdsa_verify(
+        self, h: Bytes, r: Bytes, s: Bytes, x: Bytes, y: Bytes
+    ) -> bool:
+        return ecdsa_verify(h, r, s, x, y, secp256k1(), secp256k1_generator_table())
+
+    @arc4.abimethod()
+    def p256_ecdsa_verify(
+        self, h: Bytes, r: Bytes, s: Bytes, x: Bytes, y: Bytes
+    ) -> bool:
+        return ecdsa_verify(h, r, s, x, y, p256(), p256_generator_table())
+
+    @arc4.abimethod()
+    def bn254_fixed_base_multiply(self, k: Bytes) -> Bytes:
+        curve: Curve = bn254()
+        x, y = to_affine(fixed_base_multiply(k, bn254_generator_table(), curve), curve)
+        return x + y
+
+    @arc4.abimethod()
+    def bn254_scalar_multiply(self, k: Bytes, x: Bytes, y: Bytes) -> Bytes:
+        curve: Curve = bn254()
+        point_x, point_y = to_affine(
+            scalar_multiply(k, to_jacobian(x, y, curve), curve), curve
+        )
+        return point_x + point_y
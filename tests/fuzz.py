@@ -0,0 +1,361 @@
+import json
+import os
+import random
+import typing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import product
+
+Inputs: typing.TypeAlias = tuple[bytes, ...]
+
+MAX_WIDTH: int = 1024
+MAX_EXP_WIDTH: int = 64
+EDGE_PROBABILITY: float = 0.25
+SHRINK_BUDGET: int = 400
+MAX_MESSAGE_LENGTH: int = 400
+
+
+def _to_bytes(num: int) -> bytes:
+    return num.to_bytes(max(1, (num.bit_length() + 7) // 8))
+
+
+def _edge_values() -> tuple[bytes, ...]:
+    # Zero, one, all-0xFF around the 32 and 64 byte digit boundaries, and powers of two
+    values: list[bytes] = [b"\x00", b"\x01", bytes(64)]
+    for width in (1, 31, 32, 33, 63, 64, 65, 128, MAX_WIDTH):
+        values.append(b"\xff" * width)
+    for bits in (8, 255, 256, 511, 512, 1024, 8 * MAX_WIDTH - 1):
+        values.append(_to_bytes(2**bits))
+        values.append(_to_bytes(2**bits + 1))
+    return tuple(values)
+
+
+EDGE_VALUES: tuple[bytes, ...] = _edge_values()
+EDGE_EXPONENTS: tuple[bytes, ...] = (b"\x00", b"\x01", b"\xff" * MAX_EXP_WIDTH)
+MAX_ROOT_DEGREE: int = 16
+# Degrees around the bit length of the widest operand, and the largest uint64
+EDGE_ROOT_DEGREES: tuple[bytes, ...] = (
+    b"\x01",
+    b"\x02",
+    b"\x03",
+    b"\x10",
+    _to_bytes(8 * MAX_WIDTH - 1),
+    _to_bytes(8 * MAX_WIDTH),
+    _to_bytes(2**64 - 1),
+)
+
+
+def always(*inputs: bytes) -> bool:
+    return True
+
+
+def positive_degree(a: bytes, n: bytes) -> bool:
+    return int.from_bytes(n) >= 1
+
+
+def nonzero_divisor(a: bytes, b: bytes) -> bool:
+    return int.from_bytes(b) != 0
+
+
+def valid_modulus(mod: bytes) -> bool:
+    # Barrett Reduction requires mod != 0 and mod not a power of two
+    mod_int: int = int.from_bytes(mod)
+    return mod_int & (mod_int - 1) != 0
+
+
+def barrett_bounds(a: bytes, mod: bytes) -> bool:
+    return valid_modulus(mod) and int.from_bytes(a) < int.from_bytes(mod) ** 2
+
+
+def modexp_bounds(base: bytes, exp: bytes, mod: bytes) -> bool:
+    return barrett_bounds(base, mod)
+
+
+def random_operand(rng: random.Random, min_width: int = 2) -> bytes:
+    if rng.random() < EDGE_PROBABILITY:
+        return rng.choice(EDGE_VALUES)
+    return rng.randbytes(rng.randint(min_width, MAX_WIDTH))
+
+
+def random_exponent(rng: random.Random) -> bytes:
+    if rng.random() < EDGE_PROBABILITY:
+        return rng.choice(EDGE_EXPONENTS)
+    return rng.randbytes(rng.randint(2, MAX_EXP_WIDTH))
+
+
+def random_below_square(rng: random.Random, mod: bytes) -> bytes:
+    mod_int: int = int.from_bytes(mod)
+    if mod_int == 0:
+        return b"\x00"
+    return _to_bytes(rng.randrange(mod_int**2))
+
+
+def unary_operands(rng: random.Random) -> Inputs:
+    return (random_operand(rng),)
+
+
+def binary_operands(rng: random.Random) -> Inputs:
+    return (random_operand(rng), random_operand(rng))
+
+
+def modulus_operands(rng: random.Random) -> Inputs:
+    return (random_operand(rng, min_width=1),)
+
+
+def barrett_operands(rng: random.Random) -> Inputs:
+    mod: bytes = random_operand(rng, min_width=1)
+    return (random_below_square(rng, mod), mod)
+
+
+def modexp_operands(rng: random.Random) -> Inputs:
+    mod: bytes = random_operand(rng, min_width=1)
+    return (random_below_square(rng, mod), random_exponent(rng), mod)
+
+
+def random_degree(rng: random.Random) -> bytes:
+    if rng.random() < EDGE_PROBABILITY:
+        return rng.choice(EDGE_ROOT_DEGREES)
+    return _to_bytes(rng.randint(1, MAX_ROOT_DEGREE))
+
+
+def root_operands(rng: random.Random) -> Inputs:
+    return (random_operand(rng), random_degree(rng))
+
+
+def unary_edges() -> typing.Iterator[Inputs]:
+    return ((value,) for value in EDGE_VALUES)
+
+
+def binary_edges() -> typing.Iterator[Inputs]:
+    return product(EDGE_VALUES, repeat=2)
+
+
+def root_edges() -> typing.Iterator[Inputs]:
+    return product(EDGE_VALUES, EDGE_ROOT_DEGREES)
+
+
+def modulus_edges() -> typing.Iterator[Inputs]:
+    return ((mod,) for mod in EDGE_VALUES if valid_modulus(mod))
+
+
+def _edges_below_square(mod: bytes) -> tuple[bytes, ...]:
+    mod_int: int = int.from_bytes(mod)
+    return tuple(_to_bytes(a) for a in (0, 1, mod_int - 1, mod_int, mod_int**2 - 1))
+
+
+def barrett_edges() -> typing.Iterator[Inputs]:
+    for (mod,) in modulus_edges():
+        for a in _edges_below_square(mod):
+            yield (a, mod)
+
+
+def modexp_edges() -> typing.Iterator[Inputs]:
+    for (mod,) in modulus_edges():
+        for base, exp in product(_edges_below_square(mod), EDGE_EXPONENTS):
+            yield (base, exp, mod)
+
+
+@dataclass(frozen=True)
+class Target:
+    """
+    An operator under test.
+
+    Args:
+    - check: Asserts the operator agrees with Python integers for the given inputs.
+    - generate: Draws random inputs from a seeded generator.
+    - edges: Yields the deterministic edge class inputs.
+    - precondition: Whether inputs satisfy the operator's assumptions.
+    """
+
+    check: typing.Callable[..., None]
+    generate: typing.Callable[[random.Random], Inputs]
+    edges: typing.Callable[[], typing.Iterable[Inputs]]
+    precondition: typing.Callable[..., bool] = always
+
+
+@dataclass(frozen=True)
+class Failure:
+    op: str
+    seed: int | None
+    inputs: Inputs
+    shrunk: Inputs
+    message: str
+
+
+def draw(target: Target, seed: int) -> Inputs:
+    rng: random.Random = random.Random(seed)
+    while True:
+        inputs: Inputs = target.generate(rng)
+        if target.precondition(*inputs):
+            return inputs
+
+
+def _fails(target: Target, inputs: Inputs) -> str | None:
+    try:
+        target.check(*inputs)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"[:MAX_MESSAGE_LENGTH]
+    return None
+
+
+def _simplifications(value: bytes) -> typing.Iterator[bytes]:
+    # Remove ever smaller chunks, then zero individual bytes. Never shrinks below one byte.
+    chunk: int = len(value) // 2
+    while chunk >= 1:
+        for start in range(0, len(value) - chunk + 1, chunk):
+            yield value[:start] + value[start + chunk :]
+        chunk //= 2
+    for i, byte in enumerate(value):
+        if byte != 0:
+            yield value[:i] + b"\x00" + value[i + 1 :]
+
+
+def shrink(target: Target, inputs: Inputs, budget: int = SHRINK_BUDGET) -> Inputs:
+    """
+    Greedily shrink failing inputs to shorter, smaller byte strings that still fail.
+
+    Args:
+    - target: The operator the inputs fail on.
+    - inputs: The failing inputs.
+    - budget: The maximum number of candidate inputs to evaluate.
+    """
+    current: Inputs = inputs
+    attempts: int = 0
+    improved: bool = True
+    while improved:
+        improved = False
+        for position in range(len(current)):
+            for simpler in _simplifications(current[position]):
+                if attempts >= budget:
+                    return current
+                attempts += 1
+                candidate: Inputs = (
+                    current[:position] + (simpler,) + current[position + 1 :]
+                )
+                if not target.precondition(*candidate):
+                    continue
+                if _fails(target, candidate) is not None:
+                    current = candidate
+                    improved = True
+                    break
+    return current
+
+
+def run_cases(
+    op: str, target: Target, cases: list[tuple[int | None, Inputs | None]]
+) -> list[Failure]:
+    failures: list[Failure] = []
+    for seed, inputs in cases:
+        if inputs is None:
+            inputs = draw(target, seed)
+        message: str | None = _fails(target, inputs)
+        if message is not None:
+            shrunk: Inputs = shrink(target, inputs)
+            failures.append(Failure(op, seed, inputs, shrunk, message))
+    return failures
+
+
+def fuzz(
+    targets: dict[str, Target],
+    num_cases: int,
+    seed: int,
+    workers: int | None = None,
+    batch_size: int = 100,
+) -> list[Failure]:
+    """
+    Run the edge class inputs and `num_cases` seeded random inputs for every target over a process pool.
+
+    Args:
+    - targets: The operators under test, keyed by name.
+    - num_cases: The number of random cases per operator.
+    - seed: The base seed. Each case's seed is derived from it and the operator name.
+    - workers: The number of worker processes. Runs in process when 1.
+    - batch_size: The number of cases submitted to a worker at a time.
+    """
+    jobs: list[tuple[str, Target, list[tuple[int | None, Inputs | None]]]] = []
+    for op, target in targets.items():
+        cases: list[tuple[int | None, Inputs | None]] = [
+            (None, inputs) for inputs in target.edges() if target.precondition(*inputs)
+        ]
+        rng: random.Random = random.Random(f"{seed}:{op}")
+        cases += [(rng.getrandbits(64), None) for _ in range(num_cases)]
+        for start in range(0, len(cases), batch_size):
+            jobs.append((op, target, cases[start : start + batch_size]))
+
+    if workers == 1:
+        results = [run_cases(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run_cases, *zip(*jobs)))
+    return [failure for batch in results for failure in batch]
+
+
+def _encode(failure: Failure) -> dict:
+    return {
+        "op": failure.op,
+        "seed": failure.seed,
+        "inputs": [value.hex() for value in failure.inputs],
+        "shrunk": [value.hex() for value in failure.shrunk],
+        "message": failure.message,
+    }
+
+
+def _decode(entry: dict) -> Failure:
+    return Failure(
+        entry["op"],
+        entry["seed"],
+        tuple(bytes.fromhex(value) for value in entry["inputs"]),
+        tuple(bytes.fromhex(value) for value in entry["shrunk"]),
+        entry["message"],
+    )
+
+
+def load_failures(path: str) -> list[Failure]:
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [_decode(entry) for entry in json.load(f)]
+
+
+def record_failures(failures: list[Failure], path: str) -> None:
+    """
+    Append failures to the JSON corpus at `path`, so they are replayed on later runs.
+    """
+    if len(failures) == 0:
+        return
+    recorded: list[Failure] = load_failures(path)
+    known = {(f.op, f.shrunk) for f in recorded}
+    recorded += [f for f in failures if (f.op, f.shrunk) not in known]
+    with open(path, "w") as f:
+        json.dump([_encode(failure) for failure in recorded], f, indent=2)
+
+
+def replay(targets: dict[str, Target], path: str) -> list[Failure]:
+    """
+    Re-run the recorded failures at `path`, returning the ones that still fail.
+    """
+    failures: list[Failure] = []
+    for recorded in load_failures(path):
+        target: Target = targets[recorded.op]
+        for inputs in (recorded.shrunk, recorded.inputs):
+            message: str | None = _fails(target, inputs)
+            if message is not None:
+                failures.append(
+                    Failure(
+                        recorded.op, recorded.seed, recorded.inputs, inputs, message
+                    )
+                )
+                break
+    return failures
+
+
+def describe(failures: list[Failure], seed: int | None = None) -> str:
+    lines: list[str] = [f"{len(failures)} failing case(s)"]
+    if seed is not None:
+        lines[0] += f" with BIGNUMBER_FUZZ_SEED={seed}"
+    for failure in failures:
+        shrunk: str = ", ".join(value.hex() for value in failure.shrunk)
+        lines.append(
+            f"- {failure.op} seed={failure.seed} shrunk=({shrunk}): {failure.message}"
+        )
+    return "\n".join(lines)
@@ -10,12 +10,85 @@ from puya_bignumber import (
     mod_barrett_reduce,
     barrett_reducer_factor,
     modexp_barrett_reduce,
+    BigNum,
+    to_bignum,
+    from_bignum,
+    bignum_add,
+    bignum_subtract,
+    bignum_equal,
+    bignum_multiply,
+    bignum_divide,
+    bignum_less_than,
+    bignum_greater_than,
+    bignum_barrett_reducer_factor,
+    bignum_mod_barrett_reduce,
+    bignum_modexp_barrett_reduce,
+    isqrt,
+    iroot,
+    verify_isqrt,
+    Curve,
+    JacobianPoint,
+    is_point_at_infinity,
+    to_jacobian,
+    to_affine,
+    is_on_curve,
+    point_double,
+    point_add,
+    point_add_affine,
+    scalar_multiply,
+    fixed_base_multiply,
+    ecdsa_verify,
+    secp256k1,
+    secp256k1_generator_table,
+    p256,
+    p256_generator_table,
+    bn254,
+    bn254_generator_table,
 )
 from puya_bignumber.common import pad
-from .build import build
+from puya_bignumber.profiler import profile
+from puya_bignumber.cost import OPCODE_COSTS, estimate_cost, trace_ops
+from puya_bignumber import bignumber, bignum
+from .build import build, program_size, MAX_PROGRAM_SIZE
+from .fuzz import (
+    Target,
+    fuzz,
+    replay,
+    record_failures,
+    describe,
+    unary_operands,
+    binary_operands,
+    modulus_operands,
+    barrett_operands,
+    modexp_operands,
+    root_operands,
+    unary_edges,
+    binary_edges,
+    modulus_edges,
+    barrett_edges,
+    modexp_edges,
+    root_edges,
+    positive_degree,
+    nonzero_divisor,
+    valid_modulus,
+    barrett_bounds,
+    modexp_bounds,
+)
 import os
+import typing
+import pytest
+import math
 import random
 import base64
+import hashlib
+
+NUM_TESTS: int = int(os.environ.get("BIGNUMBER_FUZZ_CASES", 30_000))
+FUZZ_WORKERS: int | None = (
+    int(os.environ["BIGNUMBER_FUZZ_WORKERS"])
+    if "BIGNUMBER_FUZZ_WORKERS" in os.environ
+    else None
+)
+FUZZ_FAILURES_PATH: str = os.path.join(os.path.dirname(__file__), "fuzz_failures.json")
 
 
 def assert_pad_works(a_bytes: bytes):
@@ -160,9 +233,534 @@ def assert_divide(a_bytes: bytes, b_bytes: bytes):
     ), f"Divide: Must be equal. {a_int}//{b_int}={expected}. Got {result}."
 
 
+def assert_bignum_layout(num: BigNum):
+    value: bytes = num.value.value
+    assert len(value) == num.digits * 64, "BigNum: Must be padded to its digits."
+    assert num.digits == 1 or any(
+        value[:64]
+    ), "BigNum: Must not have a leading zero digit."
+
+
+def assert_bignum(a_bytes: bytes, b_bytes: bytes):
+    a_int = int.from_bytes(a_bytes)
+    b_int = int.from_bytes(b_bytes)
+    a: BigNum = to_bignum(Bytes(a_bytes))
+    b: BigNum = to_bignum(Bytes(b_bytes))
+    assert_bignum_layout(a)
+    assert int.from_bytes(from_bignum(a).value) == a_int
+
+    assert bignum_equal(a, b) == (a_int == b_int), "BigNum Equal: Must be equal."
+    assert bignum_less_than(a, b) == (a_int < b_int), "BigNum Less Than: Must be equal."
+    assert bignum_greater_than(a, b) == (
+        a_int > b_int
+    ), "BigNum Greater Than: Must be equal."
+
+    big, small = (a, b) if a_int >= b_int else (b, a)
+    results: dict[str, tuple[BigNum, int]] = {
+        "Add": (bignum_add(a, b), a_int + b_int),
+        "Subtract": (bignum_subtract(big, small), abs(a_int - b_int)),
+        "Multiply": (bignum_multiply(a, b), a_int * b_int),
+    }
+    if b_int != 0:
+        results["Divide"] = (bignum_divide(a, b), a_int // b_int)
+    for name, (result, expected) in results.items():
+        assert_bignum_layout(result)
+        actual = int.from_bytes(from_bignum(result).value)
+        assert (
+            actual == expected
+        ), f"BigNum {name}: Must be equal. {a_int},{b_int}={expected}. Got {actual}."
+
+
+def assert_bignum_mod_barrett_reduce(a_bytes: bytes, mod: bytes):
+    a_int: int = int.from_bytes(a_bytes)
+    mod_int: int = int.from_bytes(mod)
+    a: BigNum = to_bignum(Bytes(a_bytes))
+    mod_bignum: BigNum = to_bignum(Bytes(mod))
+    factor: BigNum = bignum_barrett_reducer_factor(mod_bignum)
+    result: BigNum = bignum_mod_barrett_reduce(a, mod_bignum, factor)
+    assert_bignum_layout(result)
+    actual = int.from_bytes(from_bignum(result).value)
+    assert (
+        actual == a_int % mod_int
+    ), f"BigNum Modulo with Barrett Reduction: Must be equal. {a_int}%{mod_int}={a_int % mod_int}. Got {actual}."
+
+
+def assert_bignum_modexp_barrett_reduce(base_bytes: bytes, exp: bytes, mod: bytes):
+    base_int: int = int.from_bytes(base_bytes)
+    exp_int: int = int.from_bytes(exp)
+    mod_int: int = int.from_bytes(mod)
+    expected: int = pow(base_int, exp_int, mod_int)
+    base: BigNum = to_bignum(Bytes(base_bytes))
+    mod_bignum: BigNum = to_bignum(Bytes(mod))
+    factor: BigNum = bignum_barrett_reducer_factor(mod_bignum)
+    result: BigNum = bignum_modexp_barrett_reduce(base, Bytes(exp), mod_bignum, factor)
+    assert_bignum_layout(result)
+    actual = int.from_bytes(from_bignum(result).value)
+    assert (
+        actual == expected
+    ), f"BigNum Modular Exponentiation with Barrett Reduction: Must be equal. ({base_int}^{exp_int})%{mod_int}={expected}. Got {actual}."
+
+
+def iroot_reference(a_int: int, n: int) -> int:
+    if n >= a_int.bit_length():
+        # a < 2 ** n, so the root is 0 or 1, and mid ** n would not fit in memory
+        return min(a_int, 1)
+    low, high = 0, 1 << (a_int.bit_length() // n + 1)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if mid**n <= a_int:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def assert_isqrt(a_bytes: bytes):
+    a_int: int = int.from_bytes(a_bytes)
+    expected: int = math.isqrt(a_int)
+    result: Bytes = isqrt(Bytes(a_bytes))
+    assert (
+        int.from_bytes(result.value) == expected
+    ), f"Integer Square Root: Must be equal. isqrt({a_int})={expected}. Got {result}."
+    root_bytes: bytes = expected.to_bytes((expected.bit_length() + 7) // 8 + 1)
+    above_bytes: bytes = (expected + 1).to_bytes((expected.bit_length() + 8) // 8)
+    assert verify_isqrt(
+        Bytes(a_bytes), Bytes(root_bytes)
+    ), f"Verify Integer Square Root: Must accept {expected} for {a_int}."
+    assert not verify_isqrt(
+        Bytes(a_bytes), Bytes(above_bytes)
+    ), f"Verify Integer Square Root: Must reject {expected + 1} for {a_int}."
+
+
+def assert_iroot(a_bytes: bytes, n_bytes: bytes):
+    a_int: int = int.from_bytes(a_bytes)
+    n: int = int.from_bytes(n_bytes)
+    expected: int = iroot_reference(a_int, n)
+    result: Bytes = iroot(Bytes(a_bytes), UInt64(n))
+    assert (
+        int.from_bytes(result.value) == expected
+    ), f"Integer Root: Must be equal. iroot({a_int}, {n})={expected}. Got {result}."
+
+
+def assert_subtract_self(a_bytes: bytes):
+    assert_subtract(a_bytes, a_bytes)
+
+
+TARGETS: dict[str, Target] = {
+    "pad": Target(assert_pad_works, unary_operands, unary_edges),
+    "equal": Target(assert_equal, binary_operands, binary_edges),
+    "less_than": Target(assert_less_than, binary_operands, binary_edges),
+    "greater_than": Target(assert_greater_than, binary_operands, binary_edges),
+    "divide": Target(assert_divide, binary_operands, binary_edges, nonzero_divisor),
+    "multiply": Target(assert_mul, binary_operands, binary_edges),
+    "add": Target(assert_add, binary_operands, binary_edges),
+    "subtract": Target(assert_subtract, binary_operands, binary_edges),
+    "subtract_self": Target(assert_subtract_self, unary_operands, unary_edges),
+    "barrett_reducer_factor": Target(
+        assert_barrett_reducer_factor, modulus_operands, modulus_edges, valid_modulus
+    ),
+    "mod_barrett_reduce": Target(
+        assert_mod_barrett_reduce, barrett_operands, barrett_edges, barrett_bounds
+    ),
+    "modexp_barrett_reduce": Target(
+        assert_modexp_barrett_reduce, modexp_operands, modexp_edges, modexp_bounds
+    ),
+    "isqrt": Target(assert_isqrt, unary_operands, unary_edges),
+    "iroot": Target(assert_iroot, root_operands, root_edges, positive_degree),
+    "bignum": Target(assert_bignum, binary_operands, binary_edges),
+    "bignum_mod_barrett_reduce": Target(
+        assert_bignum_mod_barrett_reduce,
+        barrett_operands,
+        barrett_edges,
+        barrett_bounds,
+    ),
+    "bignum_modexp_barrett_reduce": Target(
+        assert_bignum_modexp_barrett_reduce,
+        modexp_operands,
+        modexp_edges,
+        modexp_bounds,
+    ),
+}
+
+
+def test_recorded_failures():
+    # Replay previously failing (shrunk) inputs before fuzzing new ones
+    failures = replay(TARGETS, FUZZ_FAILURES_PATH)
+    assert not failures, describe(failures)
+
+
+def test_profile():
+    a_bytes: bytes = b"\xff" * 130
+    b_bytes: bytes = b"\x07" * 129
+    with profile() as p:
+        result: Bytes = bignumber.multiply(Bytes(a_bytes), Bytes(b_bytes))
+    assert int.from_bytes(result.value) == int.from_bytes(a_bytes) * int.from_bytes(
+        b_bytes
+    )
+    rows = {row["name"]: row for row in p.rows()}
+    assert rows["multiply"]["calls"] > 1, "Karatsuba recursion must be counted"
+    assert rows["workload"]["total_ops"] == sum(p.op_totals().values())
+    assert rows["pad"]["self_bytes"] > 0
+    assert p.op_totals()["b*"] > 0
+    for line in p.folded().splitlines():
+        stack, value = line.rsplit(" ", 1)
+        assert stack.startswith("workload;multiply") and int(value) > 0
+    # Patched subroutines and ops are restored on exit
+    assert not hasattr(bignumber.multiply, "__wrapped__")
+    assert not hasattr(Bytes.__add__, "__wrapped__")
+
+
+def profiled_cost(fn, *args) -> tuple[int, int]:
+    # The emulated ops priced with the AVM opcode costs, and the subroutine calls made
+    with profile() as p:
+        fn(*args)
+    ops = p.op_totals()
+    priced: int = sum(count * OPCODE_COSTS.get(name, 1) for name, count in ops.items())
+    return priced, sum(p.calls.values())
+
+
+def assert_cost_bound(op: str, lengths: tuple[int, ...], fn, *args):
+    estimate = trace_ops(op, *lengths)
+    priced, calls = profiled_cost(fn, *args)
+    assert estimate.cost(0, 0) >= priced, f"{op}{lengths} ops under-estimated"
+    assert estimate.calls >= calls, f"{op}{lengths} calls under-estimated"
+    assert estimate_cost(op, *lengths) >= estimate.cost(0, 0)
+
+
+def test_cost_estimate():
+    rng: random.Random = random.Random(0)
+    widths: tuple[int, ...] = (1, 33, 64, 65, 130, 200)
+    for a_length in widths:
+        for b_length in widths:
+            for a_bytes, b_bytes in (
+                (b"\xff" * a_length, b"\xff" * b_length),
+                (
+                    b"\x80" + rng.randbytes(a_length - 1),
+                    b"\x80" + rng.randbytes(b_length - 1),
+                ),
+            ):
+                a, b = Bytes(a_bytes), Bytes(b_bytes)
+                lengths = (a_length, b_length)
+                assert_cost_bound("add", lengths, bignumber.add, a, b)
+                assert_cost_bound("less_than", lengths, bignumber.less_than, a, b)
+                assert_cost_bound("multiply", lengths, bignumber.multiply, a, b)
+                assert_cost_bound("divide", lengths, bignumber.divide, a, b)
+                if a_length > b_length:
+                    assert_cost_bound("subtract", lengths, bignumber.subtract, a, b)
+
+    # Takes Knuth's add back (Step D6), after the divmnu tests of Hacker's Delight
+    u_int: int = ((2**255 - 1) << 768) + (2**255 << 512)
+    v_int: int = (2**255 << 512) + 1
+    assert_cost_bound(
+        "divide",
+        (128, 96),
+        bignumber.divide,
+        Bytes(u_int.to_bytes(128)),
+        Bytes(v_int.to_bytes(96)),
+    )
+
+    for mod_int in (2**264 - 1, 2**511 + 2**510 + 1, rng.getrandbits(800) | 2**799):
+        mod: bytes = mod_int.to_bytes((mod_int.bit_length() + 7) // 8)
+        factor: Bytes = barrett_reducer_factor(Bytes(mod))
+        a: bytes = (mod_int**2 - 1).to_bytes(2 * len(mod))
+        base: bytes = rng.randrange(mod_int).to_bytes(len(mod))
+        assert_cost_bound(
+            "mod_barrett_reduce",
+            (len(a), len(mod)),
+            bignumber.mod_barrett_reduce,
+            Bytes(a),
+            Bytes(mod),
+            factor,
+        )
+        assert_cost_bound(
+            "modexp_barrett_reduce",
+            (len(base), 2, len(mod)),
+            bignumber.modexp_barrett_reduce,
+            Bytes(base),
+            Bytes(b"\xff\xff"),
+            Bytes(mod),
+            factor,
+        )
+
+    # Seeds 2 ** ceil(bits / n) twice the root take the most Newton steps
+    for a_int, n in (
+        (2**1040, 2),
+        (2**1035, 3),
+        (2**1024 - 1, 5),
+        (2**1024, 16),
+        (2**1024, 2**64 - 1),
+    ):
+        a = Bytes(a_int.to_bytes((a_int.bit_length() + 7) // 8))
+        assert_cost_bound("iroot", (len(a.value), n), bignumber.iroot, a, UInt64(n))
+        root: int = iroot_reference(a_int, n)
+        r = Bytes(root.to_bytes((root.bit_length() + 7) // 8))
+        assert_cost_bound(
+            "verify_isqrt", (len(a.value), len(r.value)), bignumber.verify_isqrt, a, r
+        )
+
+    with pytest.raises(ValueError):
+        estimate_cost("power", 32)
+
+
+def raw_chain(a: Bytes, b: Bytes) -> Bytes:
+    product: Bytes = bignumber.multiply(bignumber.add(a, b), b)
+    quotient: Bytes = bignumber.divide(product, a)
+    assert bignumber.less_than(quotient, product)
+    return bignumber.subtract(product, quotient)
+
+
+def bignum_chain(a: Bytes, b: Bytes) -> Bytes:
+    a_bignum: BigNum = bignum.to_bignum(a)
+    b_bignum: BigNum = bignum.to_bignum(b)
+    product: BigNum = bignum.bignum_multiply(
+        bignum.bignum_add(a_bignum, b_bignum), b_bignum
+    )
+    quotient: BigNum = bignum.bignum_divide(product, a_bignum)
+    assert bignum.bignum_less_than(quotient, product)
+    return bignum.from_bignum(bignum.bignum_subtract(product, quotient))
+
+
+def test_bignum_chain_cost():
+    rng: random.Random = random.Random(0)
+    for length in (40, 100, 200):
+        a, b = Bytes(rng.randbytes(length)), Bytes(rng.randbytes(length))
+        expected: int = int.from_bytes(raw_chain(a, b).value)
+        assert int.from_bytes(bignum_chain(a, b).value) == expected
+        raw_priced, raw_calls = profiled_cost(raw_chain, a, b)
+        bignum_priced, bignum_calls = profiled_cost(bignum_chain, a, b)
+        assert bignum_priced < raw_priced, f"BigNum chain of {length} bytes costs more"
+        assert bignum_calls < raw_calls, f"BigNum chain of {length} bytes calls more"
+
+
+# Curve parameters (p, a, b, generator, n) for the pure Python reference
+CURVE_PARAMETERS: dict[str, tuple[int, int, int, tuple[int, int], int]] = {
+    "secp256k1": (
+        2**256 - 2**32 - 977,
+        0,
+        7,
+        (
+            0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+            0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8,
+        ),
+        0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141,
+    ),
+    "p256": (
+        2**256 - 2**224 + 2**192 + 2**96 - 1,
+        2**256 - 2**224 + 2**192 + 2**96 - 4,
+        0x5AC635D8AA3A93E7B3EBBD55769886BC651D06B0CC53B0F63BCE3C3E27D2604B,
+        (
+            0x6B17D1F2E12C4247F8BCE6E563A440F277037D812DEB33A0F4A13945D898C296,
+            0x4FE342E2FE1A7F9B8EE7EB4A7C0F9E162BCE33576B315ECECBB6406837BF51F5,
+        ),
+        0xFFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551,
+    ),
+    "bn254": (
+        21888242871839275222246405745257275088696311157297823662689037894645226208583,
+        0,
+        3,
+        (1, 2),
+        21888242871839275222246405745257275088548364400416034343698204186575808495617,
+    ),
+}
+CURVES: dict[str, tuple[Curve, Bytes]] = {
+    "secp256k1": (secp256k1(), secp256k1_generator_table()),
+    "p256": (p256(), p256_generator_table()),
+    "bn254": (bn254(), bn254_generator_table()),
+}
+
+AffinePoint: typing.TypeAlias = tuple[int, int] | None
+
+
+def ec_add_reference(
+    a: AffinePoint, b: AffinePoint, p: int, curve_a: int
+) -> AffinePoint:
+    # Affine addition, with None at infinity
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a[0] == b[0] and (a[1] + b[1]) % p == 0:
+        return None
+    if a == b:
+        slope = (3 * a[0] ** 2 + curve_a) * pow(2 * a[1], -1, p) % p
+    else:
+        slope = (b[1] - a[1]) * pow(b[0] - a[0], -1, p) % p
+    x = (slope**2 - a[0] - b[0]) % p
+    return x, (slope * (a[0] - x) - a[1]) % p
+
+
+def ec_multiply_reference(
+    k: int, point: AffinePoint, p: int, curve_a: int
+) -> AffinePoint:
+    result: AffinePoint = None
+    while k > 0:
+        if k & 1:
+            result = ec_add_reference(result, point, p, curve_a)
+        point = ec_add_reference(point, point, p, curve_a)
+        k >>= 1
+    return result
+
+
+def ecdsa_sign_reference(
+    message_hash: bytes, private_key: int, nonce: int, curve_name: str
+) -> tuple[int, int]:
+    p, curve_a, _, generator, n = CURVE_PARAMETERS[curve_name]
+    e: int = int.from_bytes(message_hash) >> max(
+        0, 8 * len(message_hash) - n.bit_length()
+    )
+    r: int = ec_multiply_reference(nonce, generator, p, curve_a)[0] % n
+    s: int = pow(nonce, -1, n) * (e + r * private_key) % n
+    return r, s
+
+
+def jacobian(point: AffinePoint, curve: Curve) -> JacobianPoint:
+    length: int = len(curve.p.value)
+    return to_jacobian(
+        Bytes(point[0].to_bytes(length)), Bytes(point[1].to_bytes(length)), curve
+    )
+
+
+def affine(point: JacobianPoint, curve: Curve) -> AffinePoint:
+    # Normalized off-chain, as to_affine pays for a modular exponentiation
+    if is_point_at_infinity(point):
+        return None
+    p: int = int.from_bytes(curve.p.value)
+    z_inverse: int = pow(int.from_bytes(point.z.value), -1, p)
+    x: int = int.from_bytes(point.x.value) * z_inverse**2 % p
+    return x, int.from_bytes(point.y.value) * z_inverse**3 % p
+
+
+def assert_point_arithmetic(
+    curve: Curve, p: int, curve_a: int, a: AffinePoint, b: AffinePoint, k: int
+):
+    expected = ec_add_reference(a, a, p, curve_a)
+    result = affine(point_double(jacobian(a, curve), curve), curve)
+    assert result == expected, f"Point Double: Must be equal. 2{a}={expected}."
+    # Non-trivial z on both sides
+    a_doubled: JacobianPoint = point_double(jacobian(a, curve), curve)
+    b_doubled: JacobianPoint = point_double(jacobian(b, curve), curve)
+    a_2, b_2 = expected, ec_add_reference(b, b, p, curve_a)
+    expected = ec_add_reference(a_2, b_2, p, curve_a)
+    result = affine(point_add(a_doubled, b_doubled, curve), curve)
+    assert result == expected, f"Point Add: Must be equal. {a_2}+{b_2}={expected}."
+    length: int = len(curve.p.value)
+    expected = ec_add_reference(a_2, b, p, curve_a)
+    result = affine(
+        point_add_affine(
+            a_doubled, Bytes(b[0].to_bytes(length)), Bytes(b[1].to_bytes(length)), curve
+        ),
+        curve,
+    )
+    assert result == expected, f"Point Add Affine: Must be equal. {a_2}+{b}={expected}."
+
+    # Equal and opposite points
+    assert affine(point_add(a_doubled, a_doubled, curve), curve) == ec_add_reference(
+        a_2, a_2, p, curve_a
+    ), "Point Add: Must double equal points."
+    negated: AffinePoint = (a_2[0], (p - a_2[1]) % p)
+    assert is_point_at_infinity(
+        point_add(a_doubled, jacobian(negated, curve), curve)
+    ), "Point Add: Must be infinity for opposite points."
+
+    expected = ec_multiply_reference(k, a, p, curve_a)
+    result = affine(
+        scalar_multiply(
+            Bytes(k.to_bytes((k.bit_length() + 7) // 8)), jacobian(a, curve), curve
+        ),
+        curve,
+    )
+    assert result == expected, f"Scalar Multiply: Must be equal. {k}{a}={expected}."
+
+
+def test_curve():
+    rng: random.Random = random.Random(0)
+    for name, (curve, table) in CURVES.items():
+        p, curve_a, _, generator, n = CURVE_PARAMETERS[name]
+        length: int = len(curve.p.value)
+        assert int.from_bytes(curve.p.value) == p and int.from_bytes(curve.n.value) == n
+        assert curve.p_factor.value == get_barrett_precomputed_factor(curve.p.value)
+        assert curve.n_factor.value == get_barrett_precomputed_factor(curve.n.value)
+        for j in range(1, 16):
+            x, y = ec_multiply_reference(j, generator, p, curve_a)
+            entry: bytes = table.value[(j - 1) * 2 * length : j * 2 * length]
+            assert entry == x.to_bytes(length) + y.to_bytes(length), f"{name} {j}G"
+
+        a = ec_multiply_reference(rng.randrange(1, n), generator, p, curve_a)
+        b = ec_multiply_reference(rng.randrange(1, n), generator, p, curve_a)
+        assert is_on_curve(
+            Bytes(a[0].to_bytes(length)), Bytes(a[1].to_bytes(length)), curve
+        )
+        assert not is_on_curve(
+            Bytes(a[0].to_bytes(length)),
+            Bytes(((a[1] + 1) % p).to_bytes(length)),
+            curve,
+        )
+        assert_point_arithmetic(curve, p, curve_a, a, b, rng.randrange(n))
+
+        for k in (0, 1, 15, 16, n - 1, n, rng.randrange(n)):
+            scalar = Bytes(k.to_bytes(length))
+            expected = ec_multiply_reference(k, generator, p, curve_a)
+            result = affine(fixed_base_multiply(scalar, table, curve), curve)
+            assert result == expected, f"{name} Fixed Base Multiply: {k}G={expected}."
+        x, y = to_affine(point_double(jacobian(a, curve), curve), curve)
+        assert (int.from_bytes(x.value), int.from_bytes(y.value)) == ec_add_reference(
+            a, a, p, curve_a
+        ), f"{name} To Affine: Must be equal."
+
+        private_key: int = rng.randrange(1, n)
+        public_x, public_y = ec_multiply_reference(private_key, generator, p, curve_a)
+        for message_hash in (
+            hashlib.sha256(name.encode()).digest(),
+            hashlib.sha512(name.encode()).digest(),
+        ):
+            r, s = ecdsa_sign_reference(
+                message_hash, private_key, rng.randrange(1, n), name
+            )
+
+            def verify(r: int, s: int, message_hash: bytes = message_hash) -> bool:
+                return ecdsa_verify(
+                    Bytes(message_hash),
+                    Bytes(r.to_bytes(length)),
+                    Bytes(s.to_bytes(length)),
+                    Bytes(public_x.to_bytes(length)),
+                    Bytes(public_y.to_bytes(length)),
+                    curve,
+                    table,
+                )
+
+            assert verify(r, s), f"{name} ECDSA: Must accept a valid signature."
+            assert_cost_bound("ecdsa_verify", (len(message_hash), length), verify, r, s)
+            assert not verify(r, n - s + 1), f"{name} ECDSA: Must reject a wrong s."
+            assert not verify(r, s, message_hash[::-1]), f"{name} ECDSA: Wrong hash."
+            assert not verify(0, s) and not verify(r, n), f"{name} ECDSA: r range."
+
+    # A 521 bit field takes the multiply and Barrett Reduction paths. Point arithmetic does
+    # not use the group order, so n is a placeholder.
+    p: int = 2**521 - 1
+    curve_a, curve_b = p - 3, 7
+    p_bytes: bytes = p.to_bytes(66)
+    factor = Bytes(get_barrett_precomputed_factor(p_bytes))
+    wide = Curve(
+        Bytes(p_bytes),
+        factor,
+        Bytes(curve_a.to_bytes(66)),
+        Bytes(curve_b.to_bytes(66)),
+        Bytes(p_bytes),
+        factor,
+    )
+    point = (2, pow(8 + 2 * curve_a + curve_b, (p + 1) // 4, p))
+    other = ec_multiply_reference(3, point, p, curve_a)
+    assert is_on_curve(Bytes(point[0].to_bytes(66)), Bytes(point[1].to_bytes(66)), wide)
+    assert_point_arithmetic(wide, p, curve_a, point, other, rng.getrandbits(16))
+
+
 def test_all():
-    # Test that it compiles
+    # Test that it compiles, and that each tester fits the program size limit
     build("./tests", "tester_contract")
+    build("./tests", "curve_tester_contract")
+    for contract in ("BignumberTester", "CurveTester"):
+        size: int = program_size(contract)
+        assert size <= MAX_PROGRAM_SIZE, f"{contract} is {size} bytes"
     # Test that operators are accurate
     EXTREME_DIVIDEND = int(2**3600).to_bytes(451)
     EXTREME_DIVISOR_B64 = "/6fyvwqQ+ln4tmR0bFiDFnVMEHQkJcpMWOm+eR/EfQwp9b2glCuQ8wYLjcK0CfNTq2rWGv69XugNhXIrMKX8W9Fh4rh1RrrNRsrg1oj2+ppDiyRe+TL3UexbwCYlT3Is0i6iz4+ZTQVdru8pjHqtxKrtmnREB4kRszANhVJ8N4uBXxCMA/z5zLRo+/B8EZUuBSdTJUlz62E6edyNykGIqPPEzzxJZKZL0yOG3TJu5Pch0Y9nzwXJs8PcUGCG22wcCwakXXUT7D3cQ3WpztcRBXBtxfivmmqvT8ixSnLuws0h"
@@ -178,34 +776,10 @@ def test_all():
     assert_greater_than(int(2**32 - 1).to_bytes(4), int(0).to_bytes(4))
     assert_greater_than(int(0).to_bytes(4), int(2**32 - 1).to_bytes(4))
 
-    NUM_TESTS = 30_000
-    for _ in range(NUM_TESTS):
-        MAX_WIDTH = 1024
-        a_bytes = os.urandom(random.randint(2, MAX_WIDTH))
-        b_bytes = os.urandom(random.randint(2, MAX_WIDTH))
-        assert_pad_works(a_bytes)
-        assert_equal(a_bytes, b_bytes)
-        assert_less_than(a_bytes, b_bytes)
-        assert_greater_than(a_bytes, b_bytes)
-        assert_divide(a_bytes, b_bytes)
-        assert_mul(a_bytes, b_bytes)
-        assert_add(a_bytes, b_bytes)
-        assert_subtract(a_bytes, b_bytes)
-        assert_subtract(a_bytes, a_bytes)
-
-    for _ in range(NUM_TESTS):
-        # Generate a random modulus that is not a power of 2
-        MAX_WIDTH = 1024
-        mod_bytes = os.urandom(random.randint(1, MAX_WIDTH))
-        mod = int.from_bytes(mod_bytes)
-        while mod & (mod - 1) == 0:
-            mod_bytes = os.urandom(random.randint(1, MAX_WIDTH))
-
-        # Generate a random x in the range [0, mod^2)
-        a = random.randint(0, mod**2 - 1)
-        a_bytes = a.to_bytes((a.bit_length() + 7) // 8)
-        assert_barrett_reducer_factor(mod_bytes)
-        assert_mod_barrett_reduce(a_bytes, mod_bytes)
-        MAX_EXP_WIDTH = 64
-        exp_bytes = os.urandom(random.randint(2, MAX_EXP_WIDTH))
-        assert_modexp_barrett_reduce(a_bytes, exp_bytes, mod_bytes)
+    # Seeded differential fuzzing of edge classes and random cases for every operator
+    seed: int = int(
+        os.environ.get("BIGNUMBER_FUZZ_SEED", random.SystemRandom().getrandbits(32))
+    )
+    failures = fuzz(TARGETS, NUM_TESTS, seed, workers=FUZZ_WORKERS)
+    record_failures(failures, FUZZ_FAILURES_PATH)
+    assert not failures, describe(failures, seed)
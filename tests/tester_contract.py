@@ -1,6 +1,7 @@
 from algopy import (
     arc4,
     Bytes,
+    UInt64,
 )
 from puya_bignumber import (
     add,
@@ -13,6 +14,18 @@ from puya_bignumber import (
     mod_barrett_reduce,
     barrett_reducer_factor,
     modexp_barrett_reduce,
+    to_bignum,
+    from_bignum,
+    bignum_add,
+    bignum_subtract,
+    bignum_multiply,
+    bignum_divide,
+    bignum_less_than,
+    bignum_mod_barrett_reduce,
+    bignum_modexp_barrett_reduce,
+    isqrt,
+    iroot,
+    verify_isqrt,
 )
 from puya_bignumber import barrett_reducer_factor
 
@@ -57,3 +70,49 @@ class BignumberTester(arc4.ARC4Contract):
     @arc4.abimethod()
     def modexp_barrett_reduce(self, a: Bytes, b: Bytes, c: Bytes, d: Bytes) -> Bytes:
         return modexp_barrett_reduce(a, b, c, d)
+
+    @arc4.abimethod()
+    def isqrt(self, a: Bytes) -> Bytes:
+        return isqrt(a)
+
+    @arc4.abimethod()
+    def iroot(self, a: Bytes, n: UInt64) -> Bytes:
+        return iroot(a, n)
+
+    @arc4.abimethod()
+    def verify_isqrt(self, a: Bytes, r: Bytes) -> bool:
+        return verify_isqrt(a, r)
+
+    @arc4.abimethod()
+    def bignum_add(self, a: Bytes, b: Bytes) -> Bytes:
+        return from_bignum(bignum_add(to_bignum(a), to_bignum(b)))
+
+    @arc4.abimethod()
+    def bignum_subtract(self, a: Bytes, b: Bytes) -> Bytes:
+        return from_bignum(bignum_subtract(to_bignum(a), to_bignum(b)))
+
+    @arc4.abimethod()
+    def bignum_multiply(self, a: Bytes, b: Bytes) -> Bytes:
+        return from_bignum(bignum_multiply(to_bignum(a), to_bignum(b)))
+
+    @arc4.abimethod()
+    def bignum_divide(self, a: Bytes, b: Bytes) -> Bytes:
+        return from_bignum(bignum_divide(to_bignum(a), to_bignum(b)))
+
+    @arc4.abimethod()
+    def bignum_less_than(self, a: Bytes, b: Bytes) -> bool:
+        return bignum_less_than(to_bignum(a), to_bignum(b))
+
+    @arc4.abimethod()
+    def bignum_mod_barrett_reduce(self, a: Bytes, b: Bytes, c: Bytes) -> Bytes:
+        return from_bignum(
+            bignum_mod_barrett_reduce(to_bignum(a), to_bignum(b), to_bignum(c))
+        )
+
+    @arc4.abimethod()
+    def bignum_modexp_barrett_reduce(
+        self, a: Bytes, b: Bytes, c: Bytes, d: Bytes
+    ) -> Bytes:
+        return from_bignum(
+            bignum_modexp_barrett_reduce(to_bignum(a), b, to_bignum(c), to_bignum(d))
+        )